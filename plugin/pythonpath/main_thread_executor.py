@@ -134,6 +134,15 @@ def _poke_vcl():
 # Public API
 # ---------------------------------------------------------------------------
 
+def main_thread_available() -> bool:
+    """True if work can be posted to the VCL main thread.
+
+    False means execute_on_main_thread() runs functions in the calling
+    thread, so callers on other threads must not rely on it for UNO.
+    """
+    return _get_async_callback() is not None
+
+
 def execute_on_main_thread(fn: Callable, *args,
                            timeout: float = 30.0,
                            **kwargs) -> Any:
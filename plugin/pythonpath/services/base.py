@@ -8,14 +8,96 @@ GUI yield, page caching.
 
 import logging
 import os
+import re
+import threading
+import time
 import uuid
+from contextlib import contextmanager
 from typing import Any, Dict, List, Optional, Tuple
 
 import uno
 from com.sun.star.beans import PropertyValue
+from com.sun.star.container import NoSuchElementException
 
 logger = logging.getLogger(__name__)
 
+# Quiet period before a scheduled save runs (see schedule_store)
+_SAVE_DEBOUNCE = 0.5
+# Seconds a History ConfigurationAccess is reused by get_recent_documents
+_HISTORY_TTL = 5.0
+# create_document type → factory URL
+_FACTORY_URLS = {
+    "writer": "private:factory/swriter",
+    "calc": "private:factory/scalc",
+    "impress": "private:factory/simpress",
+    "draw": "private:factory/sdraw",
+}
+
+
+def _url_to_path(url: str) -> str:
+    """System path for a file:// URL; other URLs are only unescaped.
+
+    uno.fileUrlToSystemPath() gives the platform's separators and keeps
+    the leading '/' on Unix; unquote() only runs when there is a '%'.
+    """
+    if url.startswith("file://"):
+        try:
+            return uno.fileUrlToSystemPath(url)
+        except Exception:
+            pass
+    if "%" not in url:
+        return url
+    import urllib.parse
+    return urllib.parse.unquote(url)
+
+
+# [Sheet.]$A$1 — the sheet name runs up to the last dot
+_ADDR_RE = re.compile(r"^(?:(.+)\.)?\$?([A-Za-z]+)\$?(\d+)$")
+
+
+def parse_cell_address(addr: str) -> Tuple[Optional[str], int, int]:
+    """Parse 'A1' or 'Sheet1.A1' -> (sheet_name|None, col, row).
+
+    A1 notation shared by Calc cells and Writer tables. One regex
+    match; the column letters are decoded as bytes. Columns and rows
+    are 0-based. Raises ValueError on a malformed address.
+    """
+    m = _ADDR_RE.match(addr.strip())
+    if not m:
+        raise ValueError(f"Invalid cell address: {addr}")
+    sheet_name, col_str, row_str = m.groups()
+    col = 0
+    for b in col_str.upper().encode("ascii"):
+        col = col * 26 + b - 64  # ord('A') - 1
+    return sheet_name, col - 1, int(row_str) - 1
+
+
+def column_name(col: int) -> str:
+    """0-based column index to column letters (A..Z, AA.., AAA..)."""
+    name = ""
+    col += 1
+    while col:
+        col, rem = divmod(col - 1, 26)
+        name = chr(ord('A') + rem) + name
+    return name
+
+
+def _make_modify_listener(base):
+    """XModifyListener that reports document changes to ``base``."""
+    import unohelper
+    from com.sun.star.util import XModifyListener
+
+    class _DocumentWatcher(unohelper.Base, XModifyListener):
+        """Shared by all watched documents; event.Source is the model."""
+
+        def modified(self, event):
+            base._document_modified(event.Source)
+
+        def disposing(self, event):
+            base._document_disposed(event.Source)
+
+    return _DocumentWatcher()
+
 
 class BaseService:
     """Shared UNO infrastructure injected into every domain service."""
@@ -28,6 +110,26 @@ class BaseService:
         self._toolkit = self.smgr.createInstanceWithContext(
             "com.sun.star.awt.Toolkit", self.ctx)
         self._page_cache: Dict[Tuple[str, str], int] = {}
+        self._pending_store: Dict[str, Any] = {}  # doc_key → doc (batch)
+        self._save_timer = None  # threading.Timer for schedule_store
+        # guards _pending_store and _save_timer (timer thread vs callers)
+        self._store_lock = threading.Lock()
+        self.save_debounce = _SAVE_DEBOUNCE  # seconds; 0 saves at once
+        self._config_provider = None  # created on first use
+        self._history_access: Tuple[float, Any] = (0.0, None)
+        self._dispatcher = None  # DispatchHelper, created on first use
+        # requested names → (names the object supports, multi-get works)
+        # (see get_properties)
+        self._readable_props: Dict[
+            Tuple[str, ...], Tuple[Tuple[str, ...], bool]] = {}
+        # file path → open document, checked with one getURL() per hit
+        self._doc_cache: Dict[str, Any] = {}
+        # document → "writer" | "calc" | "impress" | "unknown"
+        self._doc_types: Dict[Any, str] = {}
+        self._located: Dict[Any, bool] = {}  # documents known to have a URL
+        # documents carrying our modify listener (see watch_document)
+        self._watched: Dict[Any, bool] = {}
+        self._modify_listener = None  # created on first use
         self._yield_counter = 0
         self._registry = None   # set by ServiceRegistry after construction
         logger.info("BaseService initialized")
@@ -142,6 +244,14 @@ class BaseService:
             if doc is None:
                 return {"success": True,
                         "message": "Document was not open"}
+            self._doc_cache.pop(file_path, None)
+            self._doc_types.pop(doc, None)
+            self._located.pop(doc, None)
+            # A scheduled save is an edit already reported as saved
+            with self._store_lock:
+                pending = self._pending_store.pop(self.doc_key(doc), None)
+            if pending is not None:
+                doc.store()
             doc.setModified(False)
             doc.close(True)
             return {"success": True}
@@ -150,28 +260,92 @@ class BaseService:
 
     def create_document(self, doc_type: str = "writer") -> Any:
         """Create a new document (writer, calc, impress, draw)."""
-        url_map = {
-            "writer": "private:factory/swriter",
-            "calc": "private:factory/scalc",
-            "impress": "private:factory/simpress",
-            "draw": "private:factory/sdraw",
-        }
-        url = url_map.get(doc_type, "private:factory/swriter")
+        url = _FACTORY_URLS.get(doc_type, _FACTORY_URLS["writer"])
         return self.desktop.loadComponentFromURL(url, "_blank", 0, ())
 
+    def _cached_document(self, file_path: str) -> Optional[Any]:
+        """Document previously resolved for file_path, if still open."""
+        doc = self._doc_cache.get(file_path)
+        if doc is None:
+            return None
+        try:
+            import urllib.parse
+            expected = urllib.parse.unquote(
+                uno.systemPathToFileUrl(file_path)).lower().rstrip("/")
+            current = urllib.parse.unquote(
+                doc.getURL()).lower().rstrip("/")
+            if current == expected:
+                return doc
+        except Exception:
+            pass  # closed (disposed) or saved elsewhere
+        self._doc_cache.pop(file_path, None)
+        return None
+
     def resolve_document(self, file_path: str = None) -> Any:
-        """Open by path or return the active document. Raises on failure."""
+        """Open by path or return the active document. Raises on failure.
+
+        Documents resolved by path are remembered, so repeated calls on
+        the same file skip the desktop component walk.
+        """
         if file_path:
+            doc = self._cached_document(file_path)
+            if doc is not None:
+                return doc
             result = self.open_document(file_path)
             if not result["success"]:
                 raise RuntimeError(result["error"])
-            return result["doc"]
-        doc = self.get_active_document()
-        if doc is None:
-            raise RuntimeError(
-                "No active document and no file path provided")
+            doc = result["doc"]
+            self._doc_cache[file_path] = doc
+        else:
+            doc = self.get_active_document()
+            if doc is None:
+                raise RuntimeError(
+                    "No active document and no file path provided")
+        self.watch_document(doc)
         return doc
 
+    def watch_document(self, doc):
+        """Invalidate cached views of ``doc`` whenever it changes.
+
+        Paragraph snapshots, trees and indexes are otherwise only
+        dropped by our own edits; the modify listener also catches GUI
+        edits, undo and anything else that touches the model, and
+        forgets the document when it is closed. Registered once.
+        """
+        try:
+            if doc in self._watched:
+                return
+        except TypeError:  # unhashable proxy: cannot track it
+            return
+        try:
+            if self._modify_listener is None:
+                self._modify_listener = _make_modify_listener(self)
+            doc.addModifyListener(self._modify_listener)
+            self._watched[doc] = True
+        except Exception as e:
+            logger.debug("Cannot watch document for changes: %s", e)
+
+    def _document_modified(self, doc):
+        """Modify listener callback: drop the document's caches."""
+        if self._registry is None:
+            return
+        try:
+            if not doc.isModified():
+                return  # store() resetting the flag, content unchanged
+        except Exception:
+            pass
+        self._registry.writer.invalidate_caches(doc)
+
+    def _document_disposed(self, doc):
+        """Modify listener callback: the document was closed."""
+        for cache in (self._watched, self._doc_types, self._located):
+            cache.pop(doc, None)
+        for path in [p for p, d in self._doc_cache.items() if d == doc]:
+            del self._doc_cache[path]
+        if self._registry is not None:
+            # Keys of a disposed model can no longer be computed
+            self._registry.writer.invalidate_caches()
+
     # ------------------------------------------------------------------
     # Locator resolution
     # ------------------------------------------------------------------
@@ -208,10 +382,52 @@ class BaseService:
     # Page caching
     # ------------------------------------------------------------------
 
+    def has_location(self, doc) -> bool:
+        """doc.hasLocation(), remembered once true.
+
+        A document that has a URL keeps one (storeAsURL only moves
+        it), so only untitled documents are asked again.
+        """
+        try:
+            if doc in self._located:
+                return True
+        except TypeError:  # unhashable proxy
+            return doc.hasLocation()
+        if not doc.hasLocation():
+            return False
+        if len(self._located) >= 64:
+            self._located.clear()
+        self._located[doc] = True
+        return True
+
+    @staticmethod
+    def iter_enum(enum):
+        """Yield the elements of a UNO XEnumeration.
+
+        Calls nextElement() until it raises NoSuchElementException,
+        so a walk costs one bridge call per element instead of two
+        with hasMoreElements().
+        """
+        try:
+            while True:
+                yield enum.nextElement()
+        except NoSuchElementException:
+            return
+
+    @staticmethod
+    def url_to_path(url: str) -> str:
+        """System path for a document URL (see _url_to_path)."""
+        return _url_to_path(url)
+
     def doc_key(self, doc) -> str:
-        """Stable key for a document (URL or id)."""
+        """Stable key for a document.
+
+        The URL, or for an untitled document its RuntimeUID, which,
+        unlike id() of a PyUNO proxy, is the same for every proxy of
+        the model and never reused within the session.
+        """
         try:
-            return doc.getURL() or str(id(doc))
+            return doc.getURL() or f"uid:{doc.RuntimeUID}"
         except Exception:
             return str(id(doc))
 
@@ -227,6 +443,44 @@ class BaseService:
         except Exception:
             return None
 
+    def resolve_pages(self, doc, items) -> Dict[str, int]:
+        """Cached page numbers for many (obj_name, anchor) pairs.
+
+        Cache misses share one view-cursor pass under lockControllers,
+        with the cursor restored afterwards. Unresolved names are
+        left out.
+        """
+        dk = self.doc_key(doc)
+        pages: Dict[str, int] = {}
+        misses = []
+        for name, anchor in items:
+            page = self._page_cache.get((dk, name))
+            if page is not None:
+                pages[name] = page
+            else:
+                misses.append((name, anchor))
+        if not misses:
+            return pages
+
+        vc = doc.getCurrentController().getViewCursor()
+        saved = doc.getText().createTextCursorByRange(vc.getStart())
+        doc.lockControllers()
+        try:
+            for name, anchor in misses:
+                try:
+                    vc.gotoRange(anchor, False)
+                    page = vc.getPage()
+                except Exception:
+                    continue
+                self._page_cache[(dk, name)] = page
+                pages[name] = page
+        finally:
+            try:
+                vc.gotoRange(saved, False)
+            finally:
+                doc.unlockControllers()
+        return pages
+
     def invalidate_page_cache(self, file_path: str = None):
         """Clear page cache (all or for a specific document)."""
         if file_path is None:
@@ -237,13 +491,94 @@ class BaseService:
                 if k[0] != file_path}
 
     def store_doc(self, doc):
-        """Save document and invalidate its page cache."""
-        doc.store()
+        """Save document and invalidate its page cache.
+
+        During a batch the save is deferred: the document is marked
+        dirty and written once by flush_pending_stores().
+        """
         dk = self.doc_key(doc)
+        if self._registry is not None and self._registry.batch_mode:
+            with self._store_lock:
+                self._pending_store[dk] = doc
+        else:
+            with self._store_lock:
+                self._pending_store.pop(dk, None)
+            doc.store()
         self._page_cache = {
             k: v for k, v in self._page_cache.items()
             if k[0] != dk}
 
+    def schedule_store(self, doc):
+        """Save document once writes to it go quiet.
+
+        The document is marked pending, as in a batch, and a timer
+        restarted by every call flushes all pending documents on the
+        main thread after save_debounce seconds. A burst of single
+        edits then costs one save. Within a batch, with debouncing
+        disabled, or when the timer thread could not hand the save to
+        the main thread (no AsyncCallback), this is store_doc.
+        """
+        from main_thread_executor import main_thread_available
+        if (self._registry is None or self._registry.batch_mode
+                or self.save_debounce <= 0
+                or not main_thread_available()):
+            self.store_doc(doc)
+            return
+        dk = self.doc_key(doc)
+        self._page_cache = {
+            k: v for k, v in self._page_cache.items()
+            if k[0] != dk}
+        with self._store_lock:
+            self._pending_store[dk] = doc
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(
+                self.save_debounce, self._flush_on_main_thread)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _flush_on_main_thread(self):
+        """Timer callback: run flush_pending_stores in the VCL thread."""
+        from main_thread_executor import execute_on_main_thread
+        try:
+            execute_on_main_thread(self.flush_pending_stores)
+        except Exception as e:
+            logger.warning("Scheduled save failed: %s", e)
+
+    def flush_pending_stores(self, doc=None) -> int:
+        """Save documents left dirty by a batch or schedule_store.
+
+        Only ``doc`` when given, else every pending document (one store
+        each). Returns the number of documents written.
+        """
+        dk = self.doc_key(doc) if doc is not None else None
+        with self._store_lock:
+            if dk is not None:
+                pending = {dk: self._pending_store.pop(dk)} \
+                    if dk in self._pending_store else {}
+            else:
+                pending, self._pending_store = self._pending_store, {}
+            if not self._pending_store and self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+        saved = 0
+        for dk, pdoc in pending.items():
+            try:
+                pdoc.store()
+                saved += 1
+            except Exception as e:
+                logger.warning("Deferred save failed for %s: %s", dk, e)
+        return saved
+
+    def flush_pending_saves(self, file_path: str = None) -> Dict[str, Any]:
+        """Write debounced saves now, for one document or all."""
+        try:
+            doc = self.resolve_document(file_path) if file_path else None
+            saved = self.flush_pending_stores(doc)
+            return {"success": True, "saved": saved}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
     def get_page_for_range(self, doc, text_range) -> int:
         """Page number for a text range using ViewCursor."""
         controller = doc.getCurrentController()
@@ -262,21 +597,35 @@ class BaseService:
         return self.get_page_for_range(doc, cursor)
 
     def anchor_para_index(self, doc, anchor) -> Optional[int]:
-        """Paragraph index for a text anchor (handles frame-anchored objects)."""
+        """Paragraph index for a text anchor (handles frame-anchored objects).
+
+        Resolved against the writer's cached paragraph snapshot, so a
+        listing of F objects costs one body enumeration plus a binary
+        search each, not one cursor walk per object. The index is the
+        body element index used by read_paragraphs and insert_image.
+        None when the anchor is not in the body text (table cells,
+        headers, unresolved frames).
+        """
         main_text = doc.getText()
         rng = anchor
         try:
             anchor_text = anchor.getText()
-            if anchor_text != main_text:
-                if hasattr(doc, "getTextFrames"):
-                    frames = doc.getTextFrames()
-                    for fname in frames.getElementNames():
-                        frame = frames.getByName(fname)
-                        if frame.getText() == anchor_text:
-                            rng = frame.getAnchor()
-                            break
+            if anchor_text != main_text and hasattr(doc, "getTextFrames"):
+                # A frame's XText is the frame itself: look it up by name
+                frames = doc.getTextFrames()
+                name = anchor_text.getName()
+                if frames.hasByName(name):
+                    rng = frames.getByName(name).getAnchor()
         except Exception:
             pass
+        writer = getattr(self._registry, "writer", None)
+        if writer is not None:
+            try:
+                return writer.find_paragraph_for_range(
+                    rng, writer.get_paragraph_ranges(doc), main_text,
+                    default=None)
+            except Exception:
+                pass
         try:
             tc = main_text.createTextCursorByRange(rng)
             idx = 0
@@ -286,60 +635,156 @@ class BaseService:
         except Exception:
             return None
 
-    def annotate_pages(self, nodes: list, doc):
-        """Recursively add 'page' field to heading tree nodes.
+    # ------------------------------------------------------------------
+    # Document type helpers
+    # ------------------------------------------------------------------
 
-        Uses lockControllers + cursor save/restore to prevent
-        visible viewport jumping while resolving page numbers.
+    _DOC_TYPE_SERVICES = (
+        ("writer", "com.sun.star.text.TextDocument"),
+        ("calc", "com.sun.star.sheet.SpreadsheetDocument"),
+        ("impress", "com.sun.star.presentation.PresentationDocument"),
+    )
+
+    def is_writer(self, doc) -> bool:
+        return self.get_document_type(doc) == "writer"
+
+    def is_calc(self, doc) -> bool:
+        return self.get_document_type(doc) == "calc"
+
+    def is_impress(self, doc) -> bool:
+        return self.get_document_type(doc) == "impress"
+
+    def get_document_type(self, doc) -> str:
+        """Document kind, probed once per document.
+
+        A model never changes kind, so the supportsService() calls are
+        made on first sight only. PyUNO proxies compare and hash by
+        UNO identity, so a fresh proxy of the same model hits.
+        """
+        try:
+            return self._doc_types[doc]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable proxy: probe every time
+            return self._probe_document_type(doc)
+        doc_type = self._probe_document_type(doc)
+        if len(self._doc_types) >= 64:
+            self._doc_types.clear()
+        self._doc_types[doc] = doc_type
+        return doc_type
+
+    @classmethod
+    def _probe_document_type(cls, doc) -> str:
+        for doc_type, service in cls._DOC_TYPE_SERVICES:
+            if doc.supportsService(service):
+                return doc_type
+        return "unknown"
+
+    # ------------------------------------------------------------------
+    # View locking
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    @contextmanager
+    def suspend_view(doc):
+        """Hold view updates for the duration of a model edit.
+
+        lockControllers() is reference-counted by LibreOffice, so
+        nested blocks are safe; the view repaints once at the end.
         """
-        controller = doc.getCurrentController()
-        vc = controller.getViewCursor()
-        saved = doc.getText().createTextCursorByRange(vc.getStart())
         doc.lockControllers()
         try:
-            self._annotate_pages_inner(nodes, doc)
+            yield doc
         finally:
-            vc.gotoRange(saved, False)
             doc.unlockControllers()
 
-    def _annotate_pages_inner(self, nodes: list, doc):
-        for node in nodes:
-            try:
-                pi = node.get("para_index")
-                if pi is not None:
-                    node["page"] = self.get_page_for_paragraph(doc, pi)
-            except Exception:
-                pass
-            if "children" in node:
-                self._annotate_pages_inner(node["children"], doc)
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def dispatch(self, doc, command: str, args=()):
+        """Run a .uno: command on the document's frame.
+
+        The DispatchHelper is stateless, so one instance is shared.
+        """
+        if self._dispatcher is None:
+            self._dispatcher = self.smgr.createInstanceWithContext(
+                "com.sun.star.frame.DispatchHelper", self.ctx)
+        frame = doc.getCurrentController().getFrame()
+        return self._dispatcher.executeDispatch(frame, command, "", 0, args)
 
     # ------------------------------------------------------------------
-    # Document type helpers
+    # Property helpers
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def is_writer(doc) -> bool:
-        return doc.supportsService("com.sun.star.text.TextDocument")
+    def get_properties(self, obj, names) -> Dict[str, Any]:
+        """Read several properties, in one getPropertyValues() if possible.
 
-    @staticmethod
-    def is_calc(doc) -> bool:
-        return doc.supportsService(
-            "com.sun.star.sheet.SpreadsheetDocument")
+        Returns {name: value}, leaving out properties that are missing
+        or void. When the multi-get is rejected (a name unknown to this
+        LO version, or an object that only implements XPropertySet, such
+        as annotation fields and redlines), the supported subset is found
+        through getPropertySetInfo() and read with a filtered multi-get
+        or, failing that, one getPropertyValue() per name. What worked is
+        remembered per name list; each caller's list is read from one
+        kind of object, so later objects go straight to the right path.
+        Names are sorted, as XMultiPropertySet requires.
+        """
+        if not names:
+            return {}
+        names = tuple(sorted(names))
+        cached = self._readable_props.get(names)
+        if cached is None or cached[1]:
+            readable = cached[0] if cached else names
+            try:
+                values = obj.getPropertyValues(readable)
+                return {n: v for n, v in zip(readable, values)
+                        if v is not None}
+            except Exception:
+                pass
+        if cached is not None and not cached[1]:
+            return self._get_each(obj, cached[0])
+        try:
+            info = obj.getPropertySetInfo()
+            readable = tuple(n for n in names if info.hasPropertyByName(n))
+        except Exception:
+            return self._get_each(obj, names)
+        try:
+            values = obj.getPropertyValues(readable)
+        except Exception:
+            self._readable_props[names] = (readable, False)
+            return self._get_each(obj, readable)
+        self._readable_props[names] = (readable, True)
+        return {n: v for n, v in zip(readable, values) if v is not None}
 
     @staticmethod
-    def is_impress(doc) -> bool:
-        return doc.supportsService(
-            "com.sun.star.presentation.PresentationDocument")
+    def _get_each(obj, names) -> Dict[str, Any]:
+        """get_properties fallback: one getPropertyValue() per name."""
+        result = {}
+        for name in names:
+            try:
+                value = obj.getPropertyValue(name)
+            except Exception:
+                continue
+            if value is not None:
+                result[name] = value
+        return result
 
     @staticmethod
-    def get_document_type(doc) -> str:
-        if BaseService.is_writer(doc):
-            return "writer"
-        if BaseService.is_calc(doc):
-            return "calc"
-        if BaseService.is_impress(doc):
-            return "impress"
-        return "unknown"
+    def set_properties(obj, updates: Dict[str, Any]):
+        """Write several properties with one setPropertyValues() call.
+
+        Falls back to one setPropertyValue() per name if the batch is
+        rejected, so the failing property raises its own error.
+        """
+        if not updates:
+            return
+        names = tuple(sorted(updates))
+        try:
+            obj.setPropertyValues(names, tuple(updates[n] for n in names))
+        except Exception:
+            for name in names:
+                obj.setPropertyValue(name, updates[name])
 
     # ------------------------------------------------------------------
     # Document metadata (type-agnostic)
@@ -374,14 +819,19 @@ class BaseService:
                 pass
             try:
                 user_props = props.getUserDefinedProperties()
-                info = user_props.getPropertySetInfo()
                 custom = {}
-                for prop in info.getProperties():
-                    try:
-                        custom[prop.Name] = str(
-                            user_props.getPropertyValue(prop.Name))
-                    except Exception:
-                        pass
+                try:
+                    # PropertyBag's XPropertyAccess: all values, one call
+                    for pv in user_props.getPropertyValues():
+                        custom[pv.Name] = str(pv.Value)
+                except Exception:
+                    info = user_props.getPropertySetInfo()
+                    for prop in info.getProperties():
+                        try:
+                            custom[prop.Name] = str(
+                                user_props.getPropertyValue(prop.Name))
+                        except Exception:
+                            pass
                 if custom:
                     result["custom_properties"] = custom
             except Exception:
@@ -416,8 +866,8 @@ class BaseService:
             if keywords is not None:
                 props.Keywords = tuple(keywords)
                 updated.append("keywords")
-            if updated and doc.hasLocation():
-                self.store_doc(doc)
+            if updated and self.has_location(doc):
+                self.schedule_store(doc)
             return {"success": True, "updated_fields": updated}
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -462,7 +912,7 @@ class BaseService:
         """Save the active document."""
         try:
             doc = self.resolve_document(file_path)
-            if doc.hasLocation():
+            if self.has_location(doc):
                 self.store_doc(doc)
                 return {"success": True, "message": "Document saved"}
             return {"success": False,
@@ -477,16 +927,16 @@ class BaseService:
     def get_recent_documents(self, max_count: int = 20) -> Dict[str, Any]:
         """Get recently opened documents from LO history."""
         try:
-            import urllib.parse
-            config_provider = self.smgr.createInstanceWithContext(
-                "com.sun.star.configuration.ConfigurationProvider",
-                self.ctx)
-            node_path = PropertyValue()
-            node_path.Name = "nodepath"
-            node_path.Value = "/org.openoffice.Office.Common/History"
-            access = config_provider.createInstanceWithArguments(
-                "com.sun.star.configuration.ConfigurationAccess",
-                (node_path,))
+            now = time.monotonic()
+            stamp, access = self._history_access
+            if access is None or now - stamp > _HISTORY_TTL:
+                node_path = PropertyValue()
+                node_path.Name = "nodepath"
+                node_path.Value = "/org.openoffice.Office.Common/History"
+                access = self._config().createInstanceWithArguments(
+                    "com.sun.star.configuration.ConfigurationAccess",
+                    (node_path,))
+                self._history_access = (now, access)
             pick_list = access.getByName("PickList")
             names = pick_list.getElementNames()
 
@@ -500,13 +950,8 @@ class BaseService:
                         title = item.getByName("Title")
                     except Exception:
                         pass
-                    path = ""
-                    try:
-                        path = urllib.parse.unquote(
-                            url.replace("file:///", ""))
-                    except Exception:
-                        pass
-                    docs.append({"url": url, "title": title, "path": path})
+                    docs.append({"url": url, "title": title,
+                                 "path": _url_to_path(url)})
                 except Exception:
                     pass
 
@@ -519,18 +964,23 @@ class BaseService:
     # Tracked changes — author switching & redline comments
     # ------------------------------------------------------------------
 
+    def _config(self):
+        """Shared ConfigurationProvider (created on first use)."""
+        if self._config_provider is None:
+            self._config_provider = self.smgr.createInstanceWithContext(
+                "com.sun.star.configuration.ConfigurationProvider",
+                self.ctx)
+        return self._config_provider
+
     def _user_profile_access(self, writable=False):
         """Get ConfigurationAccess for the LO user profile."""
-        config_provider = self.smgr.createInstanceWithContext(
-            "com.sun.star.configuration.ConfigurationProvider",
-            self.ctx)
         node_path = PropertyValue()
         node_path.Name = "nodepath"
         node_path.Value = "/org.openoffice.UserProfile/Data"
         mode = ("com.sun.star.configuration.ConfigurationUpdateAccess"
                 if writable else
                 "com.sun.star.configuration.ConfigurationAccess")
-        return config_provider.createInstanceWithArguments(
+        return self._config().createInstanceWithArguments(
             mode, (node_path,))
 
     def get_lo_author_parts(self):
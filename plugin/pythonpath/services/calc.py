@@ -3,7 +3,9 @@ CalcService — Calc spreadsheet operations.
 """
 
 import logging
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from .base import parse_cell_address
 
 logger = logging.getLogger(__name__)
 
@@ -22,22 +24,7 @@ class CalcService:
     @staticmethod
     def _parse_cell_address(addr: str) -> Tuple[Optional[str], int, int]:
         """Parse 'A1' or 'Sheet1.A1' -> (sheet_name|None, col, row)."""
-        sheet_name = None
-        if '.' in addr:
-            sheet_name, addr = addr.split('.', 1)
-        col_str = ""
-        row_str = ""
-        for ch in addr:
-            if ch.isalpha():
-                col_str += ch
-            else:
-                row_str += ch
-        col = 0
-        for ch in col_str.upper():
-            col = col * 26 + (ord(ch) - ord('A') + 1)
-        col -= 1  # 0-based
-        row = int(row_str) - 1  # 0-based
-        return sheet_name, col, row
+        return parse_cell_address(addr)
 
     def _get_sheet(self, doc, sheet_name: str = None):
         """Get a sheet by name or the active sheet."""
@@ -78,8 +65,8 @@ class CalcService:
 
             cell_range = sheet.getCellRangeByPosition(
                 s_col, s_row, e_col, e_row)
-            data = cell_range.getDataArray()
-            rows = [list(row) for row in data]
+            # Row tuples serialise as JSON arrays as-is: no per-row copy
+            rows = list(cell_range.getDataArray())
 
             return {
                 "success": True,
@@ -111,8 +98,8 @@ class CalcService:
             except ValueError:
                 cell_obj.setString(value)
 
-            if doc.hasLocation():
-                self._base.store_doc(doc)
+            if self._base.has_location(doc):
+                self._base.schedule_store(doc)
 
             return {
                 "success": True,
@@ -123,6 +110,56 @@ class CalcService:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    @staticmethod
+    def _cell_value(value):
+        """float when the value reads as a number, str otherwise."""
+        if value is None:
+            return ""
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return str(value)
+
+    def write_cells(self, start_cell: str, data: List[List[Any]],
+                    sheet_name: str = None,
+                    file_path: str = None) -> Dict[str, Any]:
+        """Write a 2D block of values from start_cell in one call.
+
+        The block goes through a single setDataArray() and the document
+        is saved once. Numbers are auto-detected as in write_cell.
+        """
+        try:
+            doc = self._base.resolve_document(file_path)
+            if not self._base.is_calc(doc):
+                return {"success": False, "error": "Not a Calc document"}
+            if not data or not data[0]:
+                return {"success": False, "error": "No data to write"}
+            width = len(data[0])
+            if any(len(row) != width for row in data):
+                return {"success": False,
+                        "error": "All rows must have the same length"}
+
+            parsed_sheet, col, row = self._parse_cell_address(start_cell)
+            sheet = self._get_sheet(doc, sheet_name or parsed_sheet)
+            cell_value = self._cell_value
+            block = tuple(tuple(cell_value(v) for v in r) for r in data)
+            sheet.getCellRangeByPosition(
+                col, row, col + width - 1, row + len(data) - 1
+            ).setDataArray(block)
+
+            if self._base.has_location(doc):
+                self._base.store_doc(doc)
+
+            return {
+                "success": True,
+                "start_cell": start_cell,
+                "sheet": sheet.getName(),
+                "row_count": len(data),
+                "col_count": width,
+            }
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
     def list_sheets(self, file_path: str = None) -> Dict[str, Any]:
         """List all sheets with names and basic info."""
         try:
@@ -131,18 +168,17 @@ class CalcService:
                 return {"success": False, "error": "Not a Calc document"}
 
             sheets_obj = doc.getSheets()
-            count = sheets_obj.getCount()
+            # All names in one call, in index order
+            names = sheets_obj.getElementNames()
             sheets = []
-            for i in range(count):
+            for i, name in enumerate(names):
                 sheet = sheets_obj.getByIndex(i)
                 sheets.append({
                     "index": i,
-                    "name": sheet.getName(),
-                    "is_visible": (sheet.IsVisible
-                                   if hasattr(sheet, 'IsVisible')
-                                   else True),
+                    "name": name,
+                    "is_visible": getattr(sheet, 'IsVisible', True),
                 })
-            return {"success": True, "sheets": sheets, "count": count}
+            return {"success": True, "sheets": sheets, "count": len(names)}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
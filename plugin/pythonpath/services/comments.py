@@ -3,7 +3,7 @@ CommentService — comments, annotations, and track changes.
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -14,80 +14,140 @@ class CommentService:
     def __init__(self, registry):
         self._registry = registry
         self._base = registry.base
+        self._comment_index_cache: Dict[str, Dict[str, Dict]] = {}
+
+    def invalidate_cache(self, doc=None):
+        """Clear the comment index (all or for a specific document)."""
+        if doc is None:
+            self._comment_index_cache.clear()
+        else:
+            self._comment_index_cache.pop(self._base.doc_key(doc), None)
 
     # ==================================================================
-    # Comments
+    # Comment index
     # ==================================================================
 
-    def list_comments(self, file_path: str = None) -> Dict[str, Any]:
-        """List all comments (excluding MCP-AI summaries)."""
+    @staticmethod
+    def _iter_annotation_fields(doc) -> Iterator[Tuple[Any, str, str, str]]:
+        """Yield (field, name, parent_name, author) for every annotation."""
+        enum = doc.getTextFields().createEnumeration()
+        while enum.hasMoreElements():
+            field = enum.nextElement()
+            if not field.supportsService(
+                    "com.sun.star.text.textfield.Annotation"):
+                continue
+            try:
+                name = field.getPropertyValue("Name")
+                parent = field.getPropertyValue("ParentName")
+                author = field.getPropertyValue("Author")
+            except Exception:
+                continue
+            yield field, name, parent, author
+
+    def _comment_index(self, doc, refresh: bool = False) -> Dict[str, Dict]:
+        """Annotation lookup tables, built in one enumeration pass.
+
+        Returns {"fields": [(field, name, parent, author)] in document
+        enumeration order, "by_name": {name: field}, "replies":
+        {parent: [field]}, "by_author": {author: [field]}}. Cached per
+        document and
+        dropped on every MCP edit; comments added by hand in the GUI
+        are picked up by callers retrying with refresh=True.
+        """
+        key = self._base.doc_key(doc)
+        if not refresh:
+            cached = self._comment_index_cache.get(key)
+            if cached is not None:
+                return cached
+
+        fields = list(self._iter_annotation_fields(doc))
+        by_name: Dict[str, Any] = {}
+        replies: Dict[str, List[Any]] = {}
+        by_author: Dict[str, List[Any]] = {}
+        for field, name, parent, author in fields:
+            if name:
+                by_name[name] = field
+            if parent:
+                replies.setdefault(parent, []).append(field)
+            by_author.setdefault(author, []).append(field)
+
+        index = {"fields": fields, "by_name": by_name, "replies": replies,
+                 "by_author": by_author}
+        self._comment_index_cache[key] = index
+        return index
+
+    def _find_comment(self, doc, comment_name: str):
+        """Annotation field named comment_name, or None.
+
+        A cached hit is checked against its live Name; a miss or a
+        stale entry rebuilds the index once.
+        """
+        field = self._comment_index(doc)["by_name"].get(comment_name)
         try:
-            doc = self._base.resolve_document(file_path)
-            fields = doc.getTextFields()
-            enum = fields.createEnumeration()
-            para_ranges = self._registry.writer.get_paragraph_ranges(doc)
-            text_obj = doc.getText()
+            if field is not None and \
+                    field.getPropertyValue("Name") == comment_name:
+                return field
+        except Exception:
+            pass
+        return self._comment_index(doc, refresh=True)["by_name"].get(
+            comment_name)
 
-            comments = []
-            while enum.hasMoreElements():
-                field = enum.nextElement()
-                if not field.supportsService(
-                        "com.sun.star.text.textfield.Annotation"):
-                    continue
-                try:
-                    author = field.getPropertyValue("Author")
-                except Exception:
-                    author = ""
-                if author == "MCP-AI":
-                    continue
-
-                content = field.getPropertyValue("Content")
-                name = ""
-                parent_name = ""
-                resolved = False
-                try:
-                    name = field.getPropertyValue("Name")
-                except Exception:
-                    pass
-                try:
-                    parent_name = field.getPropertyValue("ParentName")
-                except Exception:
-                    pass
-                try:
-                    resolved = field.getPropertyValue("Resolved")
-                except Exception:
-                    pass
+    # ==================================================================
+    # Comments
+    # ==================================================================
 
-                date_str = ""
-                try:
-                    dt = field.getPropertyValue("DateTimeValue")
-                    date_str = (f"{dt.Year:04d}-{dt.Month:02d}-{dt.Day:02d} "
-                                f"{dt.Hours:02d}:{dt.Minutes:02d}")
-                except Exception:
-                    pass
+    _COMMENT_PROPS = ("Content", "Resolved", "DateTimeValue")
 
-                anchor = field.getAnchor()
-                para_idx = self._registry.writer.find_paragraph_for_range(
-                    anchor, para_ranges, text_obj)
-                anchor_preview = anchor.getString()[:80]
+    def _iter_comments(self, doc) -> Iterator[Dict[str, Any]]:
+        """Yield one entry per comment (MCP-AI summaries excluded).
 
-                entry = {
-                    "author": author,
-                    "content": content,
-                    "date": date_str,
-                    "resolved": resolved,
-                    "paragraph_index": para_idx,
-                    "anchor_preview": anchor_preview,
-                }
-                if name:
-                    entry["name"] = name
-                if parent_name:
-                    entry["parent_name"] = parent_name
-                    entry["is_reply"] = True
-                else:
-                    entry["is_reply"] = False
-                comments.append(entry)
+        Runs a fresh annotation pass (picks up GUI edits) that also
+        refills the comment index.
+        """
+        index = self._comment_index(doc, refresh=True)
+        para_ranges = self._registry.writer.get_paragraph_ranges(doc)
+        text_obj = doc.getText()
+
+        for field, name, parent_name, author in index["fields"]:
+            if author == "MCP-AI":
+                continue
+            props = self._base.get_properties(field, self._COMMENT_PROPS)
+            content = props.get("Content", "")
+            resolved = props.get("Resolved", False)
+
+            date_str = ""
+            dt = props.get("DateTimeValue")
+            if dt is not None:
+                date_str = (f"{dt.Year:04d}-{dt.Month:02d}-{dt.Day:02d} "
+                            f"{dt.Hours:02d}:{dt.Minutes:02d}")
+
+            anchor = field.getAnchor()
+            para_idx = self._registry.writer.find_paragraph_for_range(
+                anchor, para_ranges, text_obj)
+            anchor_preview = anchor.getString()[:80]
+
+            entry = {
+                "author": author,
+                "content": content,
+                "date": date_str,
+                "resolved": resolved,
+                "paragraph_index": para_idx,
+                "anchor_preview": anchor_preview,
+            }
+            if name:
+                entry["name"] = name
+            if parent_name:
+                entry["parent_name"] = parent_name
+                entry["is_reply"] = True
+            else:
+                entry["is_reply"] = False
+            yield entry
 
+    def list_comments(self, file_path: str = None) -> Dict[str, Any]:
+        """List all comments (excluding MCP-AI summaries)."""
+        try:
+            doc = self._base.resolve_document(file_path)
+            comments = list(self._iter_comments(doc))
             return {"success": True, "comments": comments,
                     "count": len(comments)}
         except Exception as e:
@@ -127,10 +187,12 @@ class CommentService:
 
             doc_text = doc.getText()
             cursor = doc_text.createTextCursorByRange(target.getStart())
-            doc_text.insertTextContent(cursor, annotation, False)
+            with self._base.suspend_view(doc):
+                doc_text.insertTextContent(cursor, annotation, False)
+            self.invalidate_cache(doc)
 
-            if doc.hasLocation():
-                self._base.store_doc(doc)
+            if self._base.has_location(doc):
+                self._base.schedule_store(doc)
 
             return {"success": True,
                     "comment_name": comment_name,
@@ -146,22 +208,7 @@ class CommentService:
         """Resolve a comment with an optional reason."""
         try:
             doc = self._base.resolve_document(file_path)
-            fields = doc.getTextFields()
-            enum = fields.createEnumeration()
-            target = None
-
-            while enum.hasMoreElements():
-                field = enum.nextElement()
-                if not field.supportsService(
-                        "com.sun.star.text.textfield.Annotation"):
-                    continue
-                try:
-                    name = field.getPropertyValue("Name")
-                except Exception:
-                    continue
-                if name == comment_name:
-                    target = field
-                    break
+            target = self._find_comment(doc, comment_name)
 
             if target is None:
                 return {"success": False,
@@ -176,17 +223,20 @@ class CommentService:
                     reply.setPropertyValue("ParentName", comment_name)
                 except Exception:
                     pass
-                anchor = target.getAnchor()
-                cursor = doc.getText().createTextCursorByRange(anchor)
-                doc.getText().insertTextContent(cursor, reply, False)
 
-            try:
-                target.setPropertyValue("Resolved", True)
-            except Exception:
-                pass
+            with self._base.suspend_view(doc):
+                if resolution:
+                    anchor = target.getAnchor()
+                    cursor = doc.getText().createTextCursorByRange(anchor)
+                    doc.getText().insertTextContent(cursor, reply, False)
+                    self.invalidate_cache(doc)
+                try:
+                    target.setPropertyValue("Resolved", True)
+                except Exception:
+                    pass
 
-            if doc.hasLocation():
-                self._base.store_doc(doc)
+            if self._base.has_location(doc):
+                self._base.schedule_store(doc)
 
             return {"success": True,
                     "comment": comment_name,
@@ -209,38 +259,34 @@ class CommentService:
                 return {"success": False,
                         "error": "Provide comment_name or author"}
             doc = self._base.resolve_document(file_path)
-            fields = doc.getTextFields()
-            enum = fields.createEnumeration()
             text_obj = doc.getText()
 
-            to_delete = []
-            while enum.hasMoreElements():
-                field = enum.nextElement()
-                if not field.supportsService(
-                        "com.sun.star.text.textfield.Annotation"):
-                    continue
-                try:
-                    name = field.getPropertyValue("Name")
-                    parent = field.getPropertyValue("ParentName")
-                    field_author = field.getPropertyValue("Author")
-                except Exception:
-                    continue
-                match = False
-                if comment_name and (name == comment_name
-                                     or parent == comment_name):
-                    match = True
-                if author and field_author == author:
-                    match = True
-                if match:
-                    to_delete.append(field)
-
-            for field in to_delete:
-                text_obj.removeTextContent(field)
-
-            if to_delete and doc.hasLocation():
-                self._base.store_doc(doc)
-
-            return {"success": True, "deleted": len(to_delete)}
+            # Deleting: enumerate live rather than trust the cache
+            index = self._comment_index(doc, refresh=True)
+            candidates = []
+            if comment_name:
+                target = index["by_name"].get(comment_name)
+                if target is not None:
+                    candidates.append(target)
+                candidates.extend(index["replies"].get(comment_name, ()))
+            if author:
+                candidates.extend(index["by_author"].get(author, ()))
+
+            # One pass: skip overlaps (OR logic) and remove as we go
+            removed = set()
+            with self._base.suspend_view(doc):
+                for field in candidates:
+                    if id(field) in removed:
+                        continue
+                    removed.add(id(field))
+                    text_obj.removeTextContent(field)
+
+            if removed:
+                self.invalidate_cache(doc)
+                if self._base.has_location(doc):
+                    self._base.schedule_store(doc)
+
+            return {"success": True, "deleted": len(removed)}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -417,8 +463,8 @@ class CommentService:
             if existing:
                 existing.setPropertyValue("Content", content)
                 fields.refresh()
-                if doc.hasLocation():
-                    self._base.store_doc(doc)
+                if self._base.has_location(doc):
+                    self._base.schedule_store(doc)
                 return {"success": True, "action": "updated",
                         "content": content}
 
@@ -434,10 +480,12 @@ class CommentService:
                 first_para = para_enum.nextElement()
                 cursor = doc_text.createTextCursorByRange(
                     first_para.getStart())
-                doc_text.insertTextContent(cursor, annotation, False)
+                with self._base.suspend_view(doc):
+                    doc_text.insertTextContent(cursor, annotation, False)
+                self.invalidate_cache(doc)
 
-            if doc.hasLocation():
-                self._base.store_doc(doc)
+            if self._base.has_location(doc):
+                self._base.schedule_store(doc)
             return {"success": True, "action": "created",
                     "content": content}
         except Exception as e:
@@ -457,6 +505,9 @@ class CommentService:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    _REDLINE_PROPS = ("RedlineType", "RedlineAuthor", "RedlineComment",
+                      "RedlineIdentifier", "RedlineDateTime")
+
     def get_tracked_changes(self,
                             file_path: str = None) -> Dict[str, Any]:
         """List all tracked changes (redlines)."""
@@ -473,20 +524,13 @@ class CommentService:
             changes = []
             while enum.hasMoreElements():
                 redline = enum.nextElement()
-                entry = {}
-                for prop in ("RedlineType", "RedlineAuthor",
-                             "RedlineComment", "RedlineIdentifier"):
-                    try:
-                        entry[prop] = redline.getPropertyValue(prop)
-                    except Exception:
-                        pass
-                try:
-                    dt = redline.getPropertyValue("RedlineDateTime")
+                entry = self._base.get_properties(
+                    redline, self._REDLINE_PROPS)
+                dt = entry.pop("RedlineDateTime", None)
+                if dt is not None:
                     entry["date"] = (f"{dt.Year:04d}-{dt.Month:02d}-"
                                      f"{dt.Day:02d} {dt.Hours:02d}:"
                                      f"{dt.Minutes:02d}")
-                except Exception:
-                    pass
                 changes.append(entry)
 
             return {"success": True, "recording": recording,
@@ -494,34 +538,35 @@ class CommentService:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def accept_all_changes(self,
-                           file_path: str = None) -> Dict[str, Any]:
-        """Accept all tracked changes."""
+    def _apply_all_changes(self, file_path: str, command: str,
+                           done: str) -> Dict[str, Any]:
+        """Dispatch an accept/reject-all command with the view locked.
+
+        Skips the dispatch and the save when there are no redlines.
+        """
         try:
             doc = self._base.resolve_document(file_path)
-            dispatcher = self._base.smgr.createInstanceWithContext(
-                "com.sun.star.frame.DispatchHelper", self._base.ctx)
-            frame = doc.getCurrentController().getFrame()
-            dispatcher.executeDispatch(
-                frame, ".uno:AcceptAllTrackedChanges", "", 0, ())
-            if doc.hasLocation():
-                self._base.store_doc(doc)
-            return {"success": True, "message": "All changes accepted"}
+            if hasattr(doc, 'getRedlines') and \
+                    not doc.getRedlines().hasElements():
+                return {"success": True,
+                        "message": "No tracked changes"}
+            with self._base.suspend_view(doc):
+                self._base.dispatch(doc, command)
+            self._registry.writer.invalidate_caches(doc)
+            if self._base.has_location(doc):
+                self._base.schedule_store(doc)
+            return {"success": True, "message": f"All changes {done}"}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def accept_all_changes(self,
+                           file_path: str = None) -> Dict[str, Any]:
+        """Accept all tracked changes."""
+        return self._apply_all_changes(
+            file_path, ".uno:AcceptAllTrackedChanges", "accepted")
+
     def reject_all_changes(self,
                            file_path: str = None) -> Dict[str, Any]:
         """Reject all tracked changes."""
-        try:
-            doc = self._base.resolve_document(file_path)
-            dispatcher = self._base.smgr.createInstanceWithContext(
-                "com.sun.star.frame.DispatchHelper", self._base.ctx)
-            frame = doc.getCurrentController().getFrame()
-            dispatcher.executeDispatch(
-                frame, ".uno:RejectAllTrackedChanges", "", 0, ())
-            if doc.hasLocation():
-                self._base.store_doc(doc)
-            return {"success": True, "message": "All changes rejected"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        return self._apply_all_changes(
+            file_path, ".uno:RejectAllTrackedChanges", "rejected")
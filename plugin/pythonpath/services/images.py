@@ -10,9 +10,13 @@ import tempfile
 import time
 import urllib.request
 import urllib.error
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 
+import uno
+from com.sun.star.awt import Size as AwtSize
+from com.sun.star.text import GraphicCrop
+
 logger = logging.getLogger(__name__)
 
 _VALID_EXTS = (".png", ".jpg", ".jpeg", ".gif", ".bmp", ".svg", ".webp",
@@ -20,6 +24,99 @@ _VALID_EXTS = (".png", ".jpg", ".jpeg", ".gif", ".bmp", ".svg", ".webp",
 _MAX_RETRIES = 3
 _RETRY_DELAY = 1.0
 
+# Numeric ids used by the tools → TextContentAnchorType / wrap names
+_ANCHOR_LABELS = ("AT_PARAGRAPH", "AS_CHARACTER", "AT_PAGE", "AT_FRAME",
+                  "AT_CHARACTER")
+_ANCHOR_TYPE_IDS = {name: i for i, name in enumerate(_ANCHOR_LABELS)}
+_WRAP_NAMES = ("NONE", "COLUMN", "PARALLEL", "DYNAMIC", "THROUGH")
+
+# Properties read in one multi-get by the info/list methods
+_IMAGE_INFO_PROPS = (
+    "GraphicURL", "Description", "Title",
+    "AnchorType", "HoriOrient", "VertOrient", "Size",
+    "HoriOrientPosition", "VertOrientPosition",
+    "HoriOrientRelation", "VertOrientRelation",
+    "TopMargin", "BottomMargin", "LeftMargin", "RightMargin",
+    "Surround", "TextWrapType", "GraphicCrop",
+)
+_FRAME_INFO_PROPS = (
+    "Size", "AnchorType", "HoriOrient", "VertOrient",
+    "HoriOrientPosition", "VertOrientPosition", "Surround", "TextWrapType",
+)
+_FRAME_LIST_PROPS = ("Size", "AnchorType", "HoriOrient", "VertOrient")
+
+# Keyword fields accepted per entry by the bulk setters
+_IMAGE_UPDATE_FIELDS = frozenset((
+    "width_mm", "height_mm", "title", "description", "anchor_type",
+    "hori_orient", "vert_orient", "hori_orient_relation",
+    "vert_orient_relation", "crop_top_mm", "crop_bottom_mm",
+    "crop_left_mm", "crop_right_mm"))
+_FRAME_UPDATE_FIELDS = frozenset((
+    "width_mm", "height_mm", "anchor_type", "hori_orient", "vert_orient",
+    "hori_pos_mm", "vert_pos_mm", "wrap"))
+
+
+def _unknown_fields(spec: Dict[str, Any], allowed: frozenset,
+                    *extra: str) -> Optional[str]:
+    """Error for keys a bulk entry does not accept, None if all known."""
+    unknown = sorted(k for k in spec if k not in allowed and k not in extra)
+    if unknown:
+        return "Unknown fields: " + ", ".join(unknown)
+    return None
+
+
+def _label(names: Tuple[str, ...], ival) -> str:
+    """names[ival] for a known id, str(ival) otherwise."""
+    if isinstance(ival, int) and 0 <= ival < len(names):
+        return names[ival]
+    return str(ival)
+
+
+# (field, value) change → human-readable label, see _format_changes
+_CHANGE_LABELS = {
+    "size_mm": lambda v: f"size={v[0]}x{v[1]}mm",
+    "description": lambda v: "description set",
+    "anchor_type": lambda v: f"anchor={_label(_ANCHOR_LABELS, v)}",
+    "crop_mm": lambda v: "crop=T{}/B{}/L{}/R{}mm".format(*v),
+    "hori_pos_mm": lambda v: f"hori_pos={v}mm",
+    "vert_pos_mm": lambda v: f"vert_pos={v}mm",
+    "wrap": lambda v: f"wrap={_label(_WRAP_NAMES, v)}",
+}
+
+
+def _format_changes(changes: List[Tuple[str, Any]]) -> List[str]:
+    """Render (field, value) changes as the historical label strings."""
+    out = []
+    for field, value in changes:
+        fmt = _CHANGE_LABELS.get(field)
+        out.append(fmt(value) if fmt else f"{field}={value}")
+    return out
+
+
+def _rescale(size, width_mm: Optional[int], height_mm: Optional[int]):
+    """Set a Size struct in mm; one given side keeps the aspect ratio.
+
+    Integer math (1/100 mm units), so no float rounding drift.
+    """
+    cur_w, cur_h = size.Width, size.Height
+    if width_mm is not None and height_mm is not None:
+        size.Width = width_mm * 100
+        size.Height = height_mm * 100
+    elif width_mm is not None:
+        size.Width = width_mm * 100
+        size.Height = cur_h * size.Width // cur_w if cur_w else cur_h
+    elif height_mm is not None:
+        size.Height = height_mm * 100
+        size.Width = cur_w * size.Height // cur_h if cur_h else cur_w
+
+
+def _enum_str(val) -> str:
+    """Name of a UNO enum value (str() for plain values)."""
+    try:
+        return val.value
+    except AttributeError:
+        return str(val)
+
 
 class ImageService:
     """Image and text-frame operations via UNO."""
@@ -28,6 +125,70 @@ class ImageService:
         self._registry = registry
         self._base = registry.base
         self._url_cache: Dict[str, str] = {}  # url -> local_path
+        self._file_urls: Dict[str, str] = {}  # local path -> file:// URL
+        # doc_key -> (object counts, frame name -> graphic names)
+        self._frame_images_cache: Dict[
+            str, Tuple[Any, Dict[str, List[str]]]] = {}
+        # implementation name -> wrap property ("Surround"/"TextWrapType")
+        self._wrap_prop_cache: Dict[str, str] = {}
+
+    def invalidate_cache(self, doc=None):
+        """Clear the frame → images map (all or for a specific document)."""
+        if doc is None:
+            self._frame_images_cache.clear()
+        else:
+            self._frame_images_cache.pop(self._base.doc_key(doc), None)
+
+    @staticmethod
+    def _objects_token(doc) -> Optional[Tuple[int, int]]:
+        """Cheap change marker for the graphic and frame sets (counts)."""
+        try:
+            return (doc.getGraphicObjects().getCount(),
+                    doc.getTextFrames().getCount())
+        except Exception:
+            return None
+
+    def _frame_images(self, doc, frame_names=None) -> Dict[str, List[str]]:
+        """Frame name → names of the graphics inside it, per document.
+
+        Reused until an edit invalidates it or the graphic/frame counts
+        change, so get_text_frame_info needs no per-graphic anchor
+        lookups. Callers must not mutate the lists.
+        """
+        key = self._base.doc_key(doc)
+        token = self._objects_token(doc)
+        cached = self._frame_images_cache.get(key)
+        if cached is not None and token is not None and cached[0] == token:
+            return cached[1]
+
+        frame_images: Dict[str, List[str]] = {}
+        if hasattr(doc, 'getGraphicObjects') and hasattr(doc, 'getTextFrames'):
+            if frame_names is None:
+                frame_names = doc.getTextFrames().getElementNames()
+            name_set = set(frame_names)
+            graphics = doc.getGraphicObjects()
+            for gname in graphics.getElementNames():
+                graphic = graphics.getByName(gname)
+                try:
+                    fname = self._anchor_frame_name(
+                        graphic.getAnchor().getText(), name_set)
+                except Exception:
+                    continue
+                if fname is not None:
+                    frame_images.setdefault(fname, []).append(gname)
+        if token is not None:
+            self._frame_images_cache[key] = (token, frame_images)
+        return frame_images
+
+    def _wrap_prop(self, obj) -> str:
+        """Name of the wrap property on obj, probed once per object type."""
+        impl = obj.getImplementationName()
+        name = self._wrap_prop_cache.get(impl)
+        if name is None:
+            name = ("Surround" if obj.getPropertySetInfo()
+                    .hasPropertyByName("Surround") else "TextWrapType")
+            self._wrap_prop_cache[impl] = name
+        return name
 
     # ==================================================================
     # Image download (cache + retry + dedup)
@@ -59,6 +220,18 @@ class ImageService:
         self._url_cache[path_or_url] = local_path
         return local_path
 
+    def _file_url(self, path: str) -> str:
+        """file:// URL for a local image path (made absolute, cached).
+
+        The same downloaded or local image is often inserted many
+        times; the conversion is done once per path.
+        """
+        url = self._file_urls.get(path)
+        if url is None:
+            url = uno.systemPathToFileUrl(os.path.abspath(path))
+            self._file_urls[path] = url
+        return url
+
     def _download_with_retry(self, url: str,
                              verify_ssl: bool = False) -> str:
         """Download URL to temp file with retry logic."""
@@ -144,6 +317,64 @@ class ImageService:
     # Images
     # ==================================================================
 
+    @staticmethod
+    def _anchor_frame_name(anchor_text, frame_names) -> Optional[str]:
+        """Name of the text frame whose text is anchor_text, or None.
+
+        A frame's XText is the frame object itself, so its name says
+        which frame it is without comparing against every frame.
+        """
+        try:
+            name = anchor_text.getName()
+        except Exception:
+            return None
+        return name if name in frame_names else None
+
+    @staticmethod
+    def _lookup(container, name: str, kind: str):
+        """(element, None), or (None, error dict) listing what exists.
+
+        getByName() doubles as the membership test, so a hit costs one
+        bridge call and only a miss fetches the element names.
+        """
+        try:
+            return container.getByName(name), None
+        except Exception:
+            return None, {"success": False,
+                          "error": f"{kind} '{name}' not found",
+                          "available": list(container.getElementNames())}
+
+    def _iter_images(self, doc) -> Iterator[Tuple[Dict[str, Any], Any]]:
+        """Yield (entry, anchor) per graphic object; anchor may be None."""
+        graphics = doc.getGraphicObjects()
+        for name in graphics.getElementNames():
+            graphic = graphics.getByName(name)
+            entry = {"name": name}
+            props = self._base.get_properties(
+                graphic, ("Size", "Description", "Title"))
+            size = props.get("Size")
+            if size is not None:
+                entry["width_mm"] = size.Width // 100
+                entry["height_mm"] = size.Height // 100
+            else:
+                try:
+                    entry["width_mm"] = graphic.Width // 100
+                    entry["height_mm"] = graphic.Height // 100
+                except Exception:
+                    pass
+            if "Description" in props:
+                entry["description"] = props["Description"]
+            if "Title" in props:
+                entry["title"] = props["Title"]
+            anchor = None
+            try:
+                anchor = graphic.getAnchor()
+                entry["paragraph_index"] = self._base.anchor_para_index(
+                    doc, anchor)
+            except Exception:
+                pass
+            yield entry, anchor
+
     def list_images(self, file_path: str = None) -> Dict[str, Any]:
         """List all images/graphic objects in the document."""
         try:
@@ -152,37 +383,21 @@ class ImageService:
                 return {"success": False,
                         "error": "Document does not support graphic objects"}
 
-            graphics = doc.getGraphicObjects()
             images = []
-            for name in graphics.getElementNames():
-                graphic = graphics.getByName(name)
-                entry = {"name": name}
-                try:
-                    size = graphic.getPropertyValue("Size")
-                    entry["width_mm"] = size.Width // 100
-                    entry["height_mm"] = size.Height // 100
-                except Exception:
-                    try:
-                        entry["width_mm"] = graphic.Width // 100
-                        entry["height_mm"] = graphic.Height // 100
-                    except Exception:
-                        pass
-                try:
-                    entry["description"] = graphic.getPropertyValue(
-                        "Description")
-                    entry["title"] = graphic.getPropertyValue("Title")
-                except Exception:
-                    pass
-                try:
-                    anchor = graphic.getAnchor()
-                    entry["paragraph_index"] = self._base.anchor_para_index(
-                        doc, anchor)
-                    page = self._base.resolve_page(doc, name, anchor)
-                    if page is not None:
-                        entry["page"] = page
-                except Exception:
-                    pass
+            anchors = []
+            for entry, anchor in self._iter_images(doc):
                 images.append(entry)
+                if anchor is not None:
+                    anchors.append((entry["name"], anchor))
+
+            # Pages for all images in one locked view-cursor pass
+            try:
+                pages = self._base.resolve_pages(doc, anchors)
+            except Exception:
+                pages = {}
+            for entry in images:
+                if entry["name"] in pages:
+                    entry["page"] = pages[entry["name"]]
 
             return {"success": True, "images": images,
                     "count": len(images)}
@@ -196,40 +411,30 @@ class ImageService:
             doc = self._base.resolve_document(file_path)
             graphics = doc.getGraphicObjects()
 
-            if not graphics.hasByName(image_name):
-                return {"success": False,
-                        "error": f"Image '{image_name}' not found",
-                        "available": list(graphics.getElementNames())}
-
-            graphic = graphics.getByName(image_name)
+            graphic, error = self._lookup(graphics, image_name, "Image")
+            if error:
+                return error
             info = {"name": image_name, "success": True}
+            props = self._base.get_properties(graphic, _IMAGE_INFO_PROPS)
 
             for prop in ("GraphicURL", "Description", "Title"):
-                try:
-                    info[prop] = graphic.getPropertyValue(prop)
-                except Exception:
-                    pass
+                if prop in props:
+                    info[prop] = props[prop]
 
-            anchor_names = ["AT_PARAGRAPH", "AS_CHARACTER",
-                            "AT_PAGE", "AT_FRAME", "AT_CHARACTER"]
             for prop in ("AnchorType", "HoriOrient", "VertOrient"):
-                try:
-                    val = graphic.getPropertyValue(prop)
-                    try:
-                        str_val = val.value
-                    except AttributeError:
-                        str_val = str(val)
+                if prop in props:
+                    str_val = _enum_str(props[prop])
                     info[prop] = str_val
-                    if prop == "AnchorType" and str_val in anchor_names:
-                        info["anchor_type_id"] = anchor_names.index(str_val)
-                except Exception:
-                    pass
+                    if prop == "AnchorType":
+                        anchor_id = _ANCHOR_TYPE_IDS.get(str_val)
+                        if anchor_id is not None:
+                            info["anchor_type_id"] = anchor_id
 
-            try:
-                size = graphic.getPropertyValue("Size")
+            size = props.get("Size")
+            if size is not None:
                 info["width_mm"] = size.Width // 100
                 info["height_mm"] = size.Height // 100
-            except Exception:
+            else:
                 try:
                     info["width_mm"] = graphic.Width // 100
                     info["height_mm"] = graphic.Height // 100
@@ -237,49 +442,31 @@ class ImageService:
                     pass
 
             for prop, key in (("HoriOrientPosition", "hori_pos_mm"),
-                              ("VertOrientPosition", "vert_pos_mm")):
-                try:
-                    info[key] = graphic.getPropertyValue(prop) // 100
-                except Exception:
-                    pass
-
-            for prop in ("HoriOrientRelation", "VertOrientRelation"):
-                try:
-                    info[prop] = int(graphic.getPropertyValue(prop))
-                except Exception:
-                    pass
-
-            for prop, key in (("TopMargin", "top_margin_mm"),
+                              ("VertOrientPosition", "vert_pos_mm"),
+                              ("TopMargin", "top_margin_mm"),
                               ("BottomMargin", "bottom_margin_mm"),
                               ("LeftMargin", "left_margin_mm"),
                               ("RightMargin", "right_margin_mm")):
-                try:
-                    info[key] = graphic.getPropertyValue(prop) // 100
-                except Exception:
-                    pass
+                if prop in props:
+                    info[key] = props[prop] // 100
 
-            for prop in ("Surround", "TextWrapType"):
-                try:
-                    val = graphic.getPropertyValue(prop)
-                    wrap_names = {0: "NONE", 1: "COLUMN", 2: "PARALLEL",
-                                  3: "DYNAMIC", 4: "THROUGH"}
-                    ival = int(val)
-                    info["wrap"] = wrap_names.get(ival, str(ival))
-                    info["wrap_id"] = ival
-                    break
-                except Exception:
-                    pass
+            for prop in ("HoriOrientRelation", "VertOrientRelation"):
+                if prop in props:
+                    info[prop] = int(props[prop])
 
-            try:
-                crop = graphic.getPropertyValue("GraphicCrop")
+            ival = props.get("Surround", props.get("TextWrapType"))
+            if isinstance(ival, int):
+                info["wrap"] = _label(_WRAP_NAMES, ival)
+                info["wrap_id"] = ival
+
+            crop = props.get("GraphicCrop")
+            if crop is not None:
                 info["crop"] = {
                     "top_mm": crop.Top // 100,
                     "bottom_mm": crop.Bottom // 100,
                     "left_mm": crop.Left // 100,
                     "right_mm": crop.Right // 100,
                 }
-            except Exception:
-                pass
 
             try:
                 anchor = graphic.getAnchor()
@@ -310,106 +497,165 @@ class ImageService:
                              crop_bottom_mm: int = None,
                              crop_left_mm: int = None,
                              crop_right_mm: int = None,
-                             file_path: str = None) -> Dict[str, Any]:
-        """Resize, reposition, crop, or update caption/alt-text."""
+                             file_path: str = None,
+                             verbose: bool = True) -> Dict[str, Any]:
+        """Resize, reposition, crop, or update caption/alt-text.
+
+        changes are label strings, or raw [field, value] pairs when
+        verbose is False.
+        """
         try:
             doc = self._base.resolve_document(file_path)
             graphics = doc.getGraphicObjects()
 
-            if not graphics.hasByName(image_name):
-                return {"success": False,
-                        "error": f"Image '{image_name}' not found",
-                        "available": list(graphics.getElementNames())}
+            graphic, error = self._lookup(graphics, image_name, "Image")
+            if error:
+                return error
+            updates, changed = self._image_updates(
+                graphic, width_mm, height_mm, title, description,
+                anchor_type, hori_orient, vert_orient,
+                hori_orient_relation, vert_orient_relation,
+                crop_top_mm, crop_bottom_mm, crop_left_mm, crop_right_mm)
 
-            graphic = graphics.getByName(image_name)
-            changed = []
+            # One write, one layout pass
+            with self._base.suspend_view(doc):
+                self._base.set_properties(graphic, updates)
 
-            if width_mm is not None or height_mm is not None:
-                try:
-                    size = graphic.getPropertyValue("Size")
-                except Exception:
-                    from com.sun.star.awt import Size as AwtSize
-                    size = AwtSize(graphic.Width, graphic.Height)
-
-                cur_w = size.Width
-                cur_h = size.Height
-
-                if width_mm is not None and height_mm is not None:
-                    size.Width = width_mm * 100
-                    size.Height = height_mm * 100
-                elif width_mm is not None:
-                    ratio = (width_mm * 100) / cur_w if cur_w else 1
-                    size.Width = width_mm * 100
-                    size.Height = int(cur_h * ratio)
-                else:
-                    ratio = (height_mm * 100) / cur_h if cur_h else 1
-                    size.Height = height_mm * 100
-                    size.Width = int(cur_w * ratio)
-
-                graphic.setPropertyValue("Size", size)
-                changed.append(
-                    f"size={size.Width // 100}x{size.Height // 100}mm")
-
-            if title is not None:
-                graphic.setPropertyValue("Title", title)
-                changed.append(f"title={title}")
-
-            if description is not None:
-                graphic.setPropertyValue("Description", description)
-                changed.append("description set")
-
-            if anchor_type is not None:
-                graphic.setPropertyValue("AnchorType", anchor_type)
-                labels = {0: "AT_PARAGRAPH", 1: "AS_CHARACTER",
-                          2: "AT_PAGE", 3: "AT_FRAME", 4: "AT_CHARACTER"}
-                changed.append(
-                    f"anchor={labels.get(anchor_type, anchor_type)}")
-
-            if hori_orient is not None:
-                graphic.setPropertyValue("HoriOrient", hori_orient)
-                changed.append(f"hori_orient={hori_orient}")
-
-            if vert_orient is not None:
-                graphic.setPropertyValue("VertOrient", vert_orient)
-                changed.append(f"vert_orient={vert_orient}")
-
-            if hori_orient_relation is not None:
-                graphic.setPropertyValue(
-                    "HoriOrientRelation", hori_orient_relation)
-                changed.append(
-                    f"hori_orient_relation={hori_orient_relation}")
-
-            if vert_orient_relation is not None:
-                graphic.setPropertyValue(
-                    "VertOrientRelation", vert_orient_relation)
-                changed.append(
-                    f"vert_orient_relation={vert_orient_relation}")
-
-            if any(v is not None for v in (crop_top_mm, crop_bottom_mm,
-                                           crop_left_mm, crop_right_mm)):
-                try:
-                    crop = graphic.getPropertyValue("GraphicCrop")
-                except Exception:
-                    from com.sun.star.text import GraphicCrop
-                    crop = GraphicCrop()
-                if crop_top_mm is not None:
-                    crop.Top = crop_top_mm * 100
-                if crop_bottom_mm is not None:
-                    crop.Bottom = crop_bottom_mm * 100
-                if crop_left_mm is not None:
-                    crop.Left = crop_left_mm * 100
-                if crop_right_mm is not None:
-                    crop.Right = crop_right_mm * 100
-                graphic.setPropertyValue("GraphicCrop", crop)
-                changed.append(
-                    f"crop=T{crop.Top // 100}/B{crop.Bottom // 100}"
-                    f"/L{crop.Left // 100}/R{crop.Right // 100}mm")
-
-            if doc.hasLocation():
-                self._base.store_doc(doc)
+            if self._base.has_location(doc):
+                self._base.schedule_store(doc)
 
             return {"success": True, "image": image_name,
-                    "changes": changed}
+                    "changes": _format_changes(changed) if verbose
+                    else changed}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def _image_updates(self, graphic, width_mm: int = None,
+                       height_mm: int = None, title: str = None,
+                       description: str = None, anchor_type: int = None,
+                       hori_orient: int = None, vert_orient: int = None,
+                       hori_orient_relation: int = None,
+                       vert_orient_relation: int = None,
+                       crop_top_mm: int = None, crop_bottom_mm: int = None,
+                       crop_left_mm: int = None, crop_right_mm: int = None
+                       ) -> Tuple[Dict[str, Any], List[str]]:
+        """Property updates and (field, value) changes for an image."""
+        changed = []
+        updates = {}
+
+        wanted = []
+        if width_mm is not None or height_mm is not None:
+            wanted.append("Size")
+        if any(v is not None for v in (crop_top_mm, crop_bottom_mm,
+                                       crop_left_mm, crop_right_mm)):
+            wanted.append("GraphicCrop")
+        # One multi-get; absent properties are simply missing
+        current = self._base.get_properties(graphic, wanted)
+
+        if "Size" in wanted:
+            size = current.get("Size")
+            if size is None:
+                size = AwtSize(graphic.Width, graphic.Height)
+
+            _rescale(size, width_mm, height_mm)
+            updates["Size"] = size
+            changed.append(
+                ("size_mm", (size.Width // 100, size.Height // 100)))
+
+        if title is not None:
+            updates["Title"] = title
+            changed.append(("title", title))
+
+        if description is not None:
+            updates["Description"] = description
+            changed.append(("description", description))
+
+        if anchor_type is not None:
+            updates["AnchorType"] = anchor_type
+            changed.append(("anchor_type", anchor_type))
+
+        if hori_orient is not None:
+            updates["HoriOrient"] = hori_orient
+            changed.append(("hori_orient", hori_orient))
+
+        if vert_orient is not None:
+            updates["VertOrient"] = vert_orient
+            changed.append(("vert_orient", vert_orient))
+
+        if hori_orient_relation is not None:
+            updates["HoriOrientRelation"] = hori_orient_relation
+            changed.append(("hori_orient_relation", hori_orient_relation))
+
+        if vert_orient_relation is not None:
+            updates["VertOrientRelation"] = vert_orient_relation
+            changed.append(("vert_orient_relation", vert_orient_relation))
+
+        if "GraphicCrop" in wanted:
+            crop = current.get("GraphicCrop")
+            if crop is None:
+                crop = GraphicCrop()
+            if crop_top_mm is not None:
+                crop.Top = crop_top_mm * 100
+            if crop_bottom_mm is not None:
+                crop.Bottom = crop_bottom_mm * 100
+            if crop_left_mm is not None:
+                crop.Left = crop_left_mm * 100
+            if crop_right_mm is not None:
+                crop.Right = crop_right_mm * 100
+            updates["GraphicCrop"] = crop
+            changed.append(("crop_mm", (crop.Top // 100, crop.Bottom // 100,
+                                        crop.Left // 100, crop.Right // 100)))
+
+        return updates, changed
+
+    def set_images_properties(self, updates: List[Dict[str, Any]],
+                              file_path: str = None,
+                              verbose: bool = False) -> Dict[str, Any]:
+        """Apply set_image_properties to several images, saving once.
+
+        Each entry holds image_name plus any set_image_properties
+        field. Errors are reported per entry; changes are raw
+        [field, value] pairs unless verbose.
+        """
+        try:
+            doc = self._base.resolve_document(file_path)
+            graphics = doc.getGraphicObjects()
+            available = set(graphics.getElementNames())
+            results = []
+            applied = 0
+            with self._base.suspend_view(doc):
+                for spec in updates:
+                    name = spec.get("image_name")
+                    if name not in available:
+                        results.append({"success": False, "image": name,
+                                        "error": f"Image '{name}' not found"})
+                        continue
+                    error = _unknown_fields(spec, _IMAGE_UPDATE_FIELDS,
+                                            "image_name")
+                    if error:
+                        results.append({"success": False, "image": name,
+                                        "error": error})
+                        continue
+                    try:
+                        graphic = graphics.getByName(name)
+                        props, changed = self._image_updates(graphic, **{
+                            k: v for k, v in spec.items()
+                            if k in _IMAGE_UPDATE_FIELDS})
+                        self._base.set_properties(graphic, props)
+                        applied += 1
+                        if verbose:
+                            changed = _format_changes(changed)
+                        results.append({"success": True, "image": name,
+                                        "changes": changed})
+                    except Exception as e:
+                        results.append({"success": False, "image": name,
+                                        "error": str(e)})
+
+            if applied and self._base.has_location(doc):
+                self._base.store_doc(doc)
+
+            return {"success": applied == len(results),
+                    "updated": applied, "results": results}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -447,78 +693,128 @@ class ImageService:
                 return {"success": False,
                         "error": f"Paragraph {paragraph_index} not found"}
 
-            import uno
-            image_url = uno.systemPathToFileUrl(image_path)
+            result = self._insert_image_at(doc, target, image_path, caption,
+                                           with_frame, width_mm, height_mm)
+            self.invalidate_cache(doc)
+            if self._base.has_location(doc):
+                self._base.schedule_store(doc)
+            return result
+        except Exception as e:
+            return {"success": False, "error": str(e)}
 
-            w_100mm = (width_mm or 80) * 100
-            h_100mm = (height_mm or 80) * 100
+    def insert_images_bulk(self, images: List[Dict[str, Any]],
+                           verify_ssl: bool = False,
+                           file_path: str = None) -> Dict[str, Any]:
+        """Insert several images in one call, saving once at the end.
 
-            from com.sun.star.awt import Size as AwtSize
-            doc_text = doc.getText()
+        Each spec takes the insert_image arguments (image_path,
+        paragraph_index or locator, caption, with_frame, width_mm,
+        height_mm). Paragraph targets come from one body enumeration:
+        frames and anchored graphics add no body paragraphs, so the
+        indexes stay valid across the inserts.
+        """
+        try:
+            doc = self._base.resolve_document(file_path)
+            paras = self._registry.writer.get_paragraph_ranges(doc)
+            results = []
+            inserted = 0
+            for spec in images:
+                try:
+                    image_path = self._resolve_image(
+                        spec.get("image_path", ""), verify_ssl)
+                    if not os.path.isfile(image_path):
+                        raise ValueError(
+                            f"Image file not found: {image_path}")
+                    para_index = spec.get("paragraph_index")
+                    if para_index is None and spec.get("locator"):
+                        para_index = self._base.resolve_locator(
+                            doc, spec["locator"]).get("para_index")
+                    if para_index is None:
+                        raise ValueError(
+                            "Provide locator or paragraph_index")
+                    if not 0 <= para_index < len(paras):
+                        raise ValueError(
+                            f"Paragraph {para_index} not found")
+                    result = self._insert_image_at(
+                        doc, paras[para_index], image_path,
+                        spec.get("caption"), spec.get("with_frame", True),
+                        spec.get("width_mm"), spec.get("height_mm"))
+                    inserted += 1
+                except Exception as e:
+                    result = {"success": False, "error": str(e)}
+                results.append(result)
+
+            self.invalidate_cache(doc)
+            if inserted and self._base.has_location(doc):
+                self._base.store_doc(doc)
 
-            if with_frame:
-                frame = doc.createInstance(
-                    "com.sun.star.text.TextFrame")
-                frame_size = AwtSize(w_100mm, h_100mm)
-                frame.setPropertyValue("Size", frame_size)
-                frame.setPropertyValue("AnchorType", 4)
-                frame.setPropertyValue("HoriOrient", 0)
-                frame.setPropertyValue("VertOrient", 0)
-
-                cursor = doc_text.createTextCursorByRange(target.getEnd())
-                doc_text.insertTextContent(cursor, frame, False)
-
-                graphic = doc.createInstance(
-                    "com.sun.star.text.TextGraphicObject")
-                graphic.setPropertyValue("GraphicURL", image_url)
-                graphic_size = AwtSize(w_100mm, h_100mm)
-                graphic.setPropertyValue("Size", graphic_size)
-                graphic.setPropertyValue("AnchorType", 0)
-                graphic.setPropertyValue("HoriOrient", 2)
-                graphic.setPropertyValue("VertOrient", 1)
-
-                frame_text = frame.getText()
-                frame_cursor = frame_text.createTextCursor()
-                frame_text.insertTextContent(
-                    frame_cursor, graphic, False)
-
-                if caption:
-                    frame_cursor = frame_text.createTextCursorByRange(
-                        frame_text.getEnd())
-                    frame_text.insertControlCharacter(
-                        frame_cursor, 0, False)
-                    frame_cursor = frame_text.createTextCursorByRange(
-                        frame_text.getEnd())
-                    frame_text.insertString(frame_cursor, caption, False)
-
-                if doc.hasLocation():
-                    self._base.store_doc(doc)
-
-                return {"success": True,
-                        "frame_name": frame.getName(),
-                        "image_name": graphic.getName(),
-                        "with_frame": True,
-                        "caption": caption}
-            else:
-                graphic = doc.createInstance(
-                    "com.sun.star.text.TextGraphicObject")
-                graphic.setPropertyValue("GraphicURL", image_url)
-                graphic_size = AwtSize(w_100mm, h_100mm)
-                graphic.setPropertyValue("Size", graphic_size)
-                graphic.setPropertyValue("AnchorType", 4)
-
-                cursor = doc_text.createTextCursorByRange(target.getEnd())
-                doc_text.insertTextContent(cursor, graphic, False)
-
-                if doc.hasLocation():
-                    self._base.store_doc(doc)
-
-                return {"success": True,
-                        "image_name": graphic.getName(),
-                        "with_frame": False}
+            return {"success": inserted == len(results),
+                    "inserted": inserted, "results": results}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def _insert_image_at(self, doc, target, image_path: str,
+                         caption: str = None, with_frame: bool = True,
+                         width_mm: int = None,
+                         height_mm: int = None) -> Dict[str, Any]:
+        """Insert one image after a body element. Does not save."""
+        image_url = self._file_url(image_path)
+
+        w_100mm = (width_mm or 80) * 100
+        h_100mm = (height_mm or 80) * 100
+
+        doc_text = doc.getText()
+        # Structs are copied into the Any on each write: one is enough
+        size = AwtSize(w_100mm, h_100mm)
+
+        if with_frame:
+            frame = doc.createInstance(
+                "com.sun.star.text.TextFrame")
+            self._base.set_properties(frame, {
+                "Size": size, "AnchorType": 4,
+                "HoriOrient": 0, "VertOrient": 0})
+
+            cursor = doc_text.createTextCursorByRange(target.getEnd())
+            doc_text.insertTextContent(cursor, frame, False)
+
+            graphic = doc.createInstance(
+                "com.sun.star.text.TextGraphicObject")
+            self._base.set_properties(graphic, {
+                "GraphicURL": image_url, "Size": size, "AnchorType": 0,
+                "HoriOrient": 2, "VertOrient": 1})
+
+            frame_text = frame.getText()
+            frame_cursor = frame_text.createTextCursor()
+            frame_text.insertTextContent(
+                frame_cursor, graphic, False)
+
+            if caption:
+                frame_cursor = frame_text.createTextCursorByRange(
+                    frame_text.getEnd())
+                frame_text.insertControlCharacter(
+                    frame_cursor, 0, False)
+                frame_cursor = frame_text.createTextCursorByRange(
+                    frame_text.getEnd())
+                frame_text.insertString(frame_cursor, caption, False)
+
+            return {"success": True,
+                    "frame_name": frame.getName(),
+                    "image_name": graphic.getName(),
+                    "with_frame": True,
+                    "caption": caption}
+
+        graphic = doc.createInstance(
+            "com.sun.star.text.TextGraphicObject")
+        self._base.set_properties(graphic, {
+            "GraphicURL": image_url, "Size": size, "AnchorType": 4})
+
+        cursor = doc_text.createTextCursorByRange(target.getEnd())
+        doc_text.insertTextContent(cursor, graphic, False)
+
+        return {"success": True,
+                "image_name": graphic.getName(),
+                "with_frame": False}
+
     def delete_image(self, image_name: str,
                      remove_frame: bool = True,
                      file_path: str = None) -> Dict[str, Any]:
@@ -530,25 +826,22 @@ class ImageService:
                         "error": "Document does not support graphic objects"}
 
             graphics = doc.getGraphicObjects()
-            if not graphics.hasByName(image_name):
-                return {"success": False,
-                        "error": f"Image '{image_name}' not found",
-                        "available": list(graphics.getElementNames())}
-
-            graphic = graphics.getByName(image_name)
+            graphic, error = self._lookup(graphics, image_name, "Image")
+            if error:
+                return error
             doc_text = doc.getText()
 
             anchor_text = graphic.getAnchor().getText()
             frame_name = None
             parent_frame = None
-            if hasattr(doc, 'getTextFrames'):
-                frames_access = doc.getTextFrames()
-                for fname in frames_access.getElementNames():
-                    fr = frames_access.getByName(fname)
-                    if fr.getText() == anchor_text:
-                        frame_name = fname
-                        parent_frame = fr
-                        break
+            frames_access = (doc.getTextFrames()
+                             if hasattr(doc, 'getTextFrames') else None)
+            # Standalone graphics in frame-less documents: no lookup
+            if frames_access is not None and frames_access.hasElements():
+                frame_name = self._anchor_frame_name(
+                    anchor_text, set(frames_access.getElementNames()))
+                if frame_name is not None:
+                    parent_frame = frames_access.getByName(frame_name)
 
             if frame_name is not None and remove_frame:
                 doc_text.removeTextContent(parent_frame)
@@ -557,8 +850,9 @@ class ImageService:
             else:
                 doc_text.removeTextContent(graphic)
 
-            if doc.hasLocation():
-                self._base.store_doc(doc)
+            self.invalidate_cache(doc)
+            if self._base.has_location(doc):
+                self._base.schedule_store(doc)
 
             result = {"success": True, "deleted_image": image_name}
             if frame_name and remove_frame:
@@ -586,36 +880,19 @@ class ImageService:
 
             doc = self._base.resolve_document(file_path)
             graphics = doc.getGraphicObjects()
-            if not graphics.hasByName(image_name):
-                return {"success": False,
-                        "error": f"Image '{image_name}' not found",
-                        "available": list(graphics.getElementNames())}
-
-            graphic = graphics.getByName(image_name)
-
-            import uno
-            image_url = uno.systemPathToFileUrl(new_image_path)
-            graphic.setPropertyValue("GraphicURL", image_url)
+            graphic, error = self._lookup(graphics, image_name, "Image")
+            if error:
+                return error
 
+            updates = {"GraphicURL": self._file_url(new_image_path)}
             if width_mm is not None or height_mm is not None:
                 size = graphic.getPropertyValue("Size")
-                cur_w = size.Width
-                cur_h = size.Height
-                if width_mm is not None and height_mm is not None:
-                    size.Width = width_mm * 100
-                    size.Height = height_mm * 100
-                elif width_mm is not None:
-                    ratio = (width_mm * 100) / cur_w if cur_w else 1
-                    size.Width = width_mm * 100
-                    size.Height = int(cur_h * ratio)
-                else:
-                    ratio = (height_mm * 100) / cur_h if cur_h else 1
-                    size.Height = height_mm * 100
-                    size.Width = int(cur_w * ratio)
-                graphic.setPropertyValue("Size", size)
-
-            if doc.hasLocation():
-                self._base.store_doc(doc)
+                _rescale(size, width_mm, height_mm)
+                updates["Size"] = size
+            self._base.set_properties(graphic, updates)
+
+            if self._base.has_location(doc):
+                self._base.schedule_store(doc)
 
             return {"success": True, "image_name": image_name,
                     "new_source": new_image_path}
@@ -635,61 +912,46 @@ class ImageService:
                         "error": "Document does not support text frames"}
 
             frames_access = doc.getTextFrames()
-
-            frame_images = {}
-            if hasattr(doc, 'getGraphicObjects'):
-                graphics = doc.getGraphicObjects()
-                for gname in graphics.getElementNames():
-                    graphic = graphics.getByName(gname)
-                    try:
-                        anchor_text = graphic.getAnchor().getText()
-                        for fname in frames_access.getElementNames():
-                            fr = frames_access.getByName(fname)
-                            if fr.getText() == anchor_text:
-                                frame_images.setdefault(
-                                    fname, []).append(gname)
-                                break
-                    except Exception:
-                        pass
+            frame_names = frames_access.getElementNames()
+            frame_images = self._frame_images(doc, frame_names)
 
             result = []
-            for fname in frames_access.getElementNames():
+            anchors = []
+            for fname in frame_names:
                 frame = frames_access.getByName(fname)
                 entry = {"name": fname}
-                try:
-                    size = frame.getPropertyValue("Size")
+                props = self._base.get_properties(frame, _FRAME_LIST_PROPS)
+                size = props.get("Size")
+                if size is not None:
                     entry["width_mm"] = size.Width // 100
                     entry["height_mm"] = size.Height // 100
-                except Exception:
-                    pass
-                try:
-                    val = frame.getPropertyValue("AnchorType")
-                    try:
-                        entry["anchor_type"] = val.value
-                    except AttributeError:
-                        entry["anchor_type"] = str(val)
-                except Exception:
-                    pass
+                if "AnchorType" in props:
+                    entry["anchor_type"] = _enum_str(props["AnchorType"])
                 for prop, key in (("HoriOrient", "hori_orient"),
                                   ("VertOrient", "vert_orient")):
-                    try:
-                        entry[key] = int(frame.getPropertyValue(prop))
-                    except Exception:
-                        pass
+                    if prop in props:
+                        entry[key] = int(props[prop])
                 try:
                     anchor = frame.getAnchor()
+                    anchors.append((fname, anchor))
                     pidx = self._base.anchor_para_index(doc, anchor)
                     if pidx is not None:
                         entry["paragraph_index"] = pidx
-                    page = self._base.resolve_page(doc, fname, anchor)
-                    if page is not None:
-                        entry["page"] = page
                 except Exception:
                     pass
                 if fname in frame_images:
-                    entry["images"] = frame_images[fname]
+                    entry["images"] = list(frame_images[fname])
                 result.append(entry)
 
+            # Pages for all frames in one locked view-cursor pass
+            try:
+                pages = self._base.resolve_pages(doc, anchors)
+            except Exception:
+                pages = {}
+            for entry in result:
+                if entry["name"] in pages:
+                    entry["page"] = pages[entry["name"]]
+
             return {"success": True, "frames": result,
                     "count": len(result)}
         except Exception as e:
@@ -702,59 +964,37 @@ class ImageService:
             doc = self._base.resolve_document(file_path)
             frames_access = doc.getTextFrames()
 
-            if not frames_access.hasByName(frame_name):
-                return {"success": False,
-                        "error": f"Frame '{frame_name}' not found",
-                        "available": list(frames_access.getElementNames())}
-
-            frame = frames_access.getByName(frame_name)
+            frame, error = self._lookup(frames_access, frame_name, "Frame")
+            if error:
+                return error
             info = {"name": frame_name, "success": True}
+            props = self._base.get_properties(frame, _FRAME_INFO_PROPS)
 
-            try:
-                size = frame.getPropertyValue("Size")
+            size = props.get("Size")
+            if size is not None:
                 info["width_mm"] = size.Width // 100
                 info["height_mm"] = size.Height // 100
-            except Exception:
-                pass
 
-            anchor_names = ["AT_PARAGRAPH", "AS_CHARACTER",
-                            "AT_PAGE", "AT_FRAME", "AT_CHARACTER"]
-            try:
-                val = frame.getPropertyValue("AnchorType")
-                try:
-                    str_val = val.value
-                except AttributeError:
-                    str_val = str(val)
+            if "AnchorType" in props:
+                str_val = _enum_str(props["AnchorType"])
                 info["anchor_type"] = str_val
-                if str_val in anchor_names:
-                    info["anchor_type_id"] = anchor_names.index(str_val)
-            except Exception:
-                pass
+                anchor_id = _ANCHOR_TYPE_IDS.get(str_val)
+                if anchor_id is not None:
+                    info["anchor_type_id"] = anchor_id
 
             for prop in ("HoriOrient", "VertOrient"):
-                try:
-                    info[prop] = int(frame.getPropertyValue(prop))
-                except Exception:
-                    pass
+                if prop in props:
+                    info[prop] = int(props[prop])
 
             for prop, key in (("HoriOrientPosition", "hori_pos_mm"),
                               ("VertOrientPosition", "vert_pos_mm")):
-                try:
-                    info[key] = frame.getPropertyValue(prop) // 100
-                except Exception:
-                    pass
+                if prop in props:
+                    info[key] = props[prop] // 100
 
-            for prop in ("Surround", "TextWrapType"):
-                try:
-                    val = frame.getPropertyValue(prop)
-                    wrap_names = {0: "NONE", 1: "COLUMN", 2: "PARALLEL",
-                                  3: "DYNAMIC", 4: "THROUGH"}
-                    ival = int(val)
-                    info["wrap"] = wrap_names.get(ival, str(ival))
-                    info["wrap_id"] = ival
-                    break
-                except Exception:
-                    pass
+            ival = props.get("Surround", props.get("TextWrapType"))
+            if isinstance(ival, int):
+                info["wrap"] = _label(_WRAP_NAMES, ival)
+                info["wrap_id"] = ival
 
             try:
                 anchor = frame.getAnchor()
@@ -774,19 +1014,9 @@ class ImageService:
             except Exception:
                 pass
 
-            if hasattr(doc, 'getGraphicObjects'):
-                imgs = []
-                graphics = doc.getGraphicObjects()
-                ft = frame.getText()
-                for gname in graphics.getElementNames():
-                    graphic = graphics.getByName(gname)
-                    try:
-                        if graphic.getAnchor().getText() == ft:
-                            imgs.append(gname)
-                    except Exception:
-                        pass
-                if imgs:
-                    info["images"] = imgs
+            imgs = self._frame_images(doc).get(frame_name)
+            if imgs:
+                info["images"] = list(imgs)
 
             return info
         except Exception as e:
@@ -802,78 +1032,144 @@ class ImageService:
                                   vert_pos_mm: int = None,
                                   wrap: int = None,
                                   paragraph_index: int = None,
-                                  file_path: str = None) -> Dict[str, Any]:
-        """Modify text frame properties."""
+                                  file_path: str = None,
+                                  verbose: bool = True) -> Dict[str, Any]:
+        """Modify text frame properties (changes as for images)."""
         try:
             doc = self._base.resolve_document(file_path)
             frames_access = doc.getTextFrames()
 
-            if not frames_access.hasByName(frame_name):
-                return {"success": False,
-                        "error": f"Frame '{frame_name}' not found",
-                        "available": list(frames_access.getElementNames())}
-
-            frame = frames_access.getByName(frame_name)
-            changed = []
+            frame, error = self._lookup(frames_access, frame_name, "Frame")
+            if error:
+                return error
+            updates, changed = self._frame_updates(
+                frame, width_mm, height_mm, anchor_type, hori_orient,
+                vert_orient, hori_pos_mm, vert_pos_mm, wrap)
 
-            if width_mm is not None or height_mm is not None:
-                size = frame.getPropertyValue("Size")
-                if width_mm is not None:
-                    size.Width = width_mm * 100
-                if height_mm is not None:
-                    size.Height = height_mm * 100
-                frame.setPropertyValue("Size", size)
-                changed.append(
-                    f"size={size.Width // 100}x{size.Height // 100}mm")
-
-            if anchor_type is not None:
-                frame.setPropertyValue("AnchorType", anchor_type)
-                labels = {0: "AT_PARAGRAPH", 1: "AS_CHARACTER",
-                          2: "AT_PAGE", 3: "AT_FRAME", 4: "AT_CHARACTER"}
-                changed.append(
-                    f"anchor={labels.get(anchor_type, anchor_type)}")
-
-            if hori_orient is not None:
-                frame.setPropertyValue("HoriOrient", hori_orient)
-                changed.append(f"hori_orient={hori_orient}")
-
-            if vert_orient is not None:
-                frame.setPropertyValue("VertOrient", vert_orient)
-                changed.append(f"vert_orient={vert_orient}")
-
-            if hori_pos_mm is not None:
-                frame.setPropertyValue(
-                    "HoriOrientPosition", hori_pos_mm * 100)
-                changed.append(f"hori_pos={hori_pos_mm}mm")
-
-            if vert_pos_mm is not None:
-                frame.setPropertyValue(
-                    "VertOrientPosition", vert_pos_mm * 100)
-                changed.append(f"vert_pos={vert_pos_mm}mm")
-
-            if wrap is not None:
-                try:
-                    frame.setPropertyValue("Surround", wrap)
-                except Exception:
-                    frame.setPropertyValue("TextWrapType", wrap)
-                wrap_names = {0: "NONE", 1: "COLUMN", 2: "PARALLEL",
-                              3: "DYNAMIC", 4: "THROUGH"}
-                changed.append(f"wrap={wrap_names.get(wrap, wrap)}")
+            with self._base.suspend_view(doc):
+                self._base.set_properties(frame, updates)
 
             if paragraph_index is not None:
-                text = doc.getText()
-                cursor = text.createTextCursor()
-                cursor.gotoStart(False)
-                for _ in range(paragraph_index):
-                    if not cursor.gotoNextParagraph(False):
-                        break
-                frame.attach(cursor)
-                changed.append(f"paragraph_index={paragraph_index}")
-
-            if doc.hasLocation():
-                self._base.store_doc(doc)
+                self._attach_frame(doc, frame, paragraph_index)
+                changed.append(("paragraph_index", paragraph_index))
+
+            if self._base.has_location(doc):
+                self._base.schedule_store(doc)
 
             return {"success": True, "frame": frame_name,
-                    "changes": changed}
+                    "changes": _format_changes(changed) if verbose
+                    else changed}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    @staticmethod
+    def _attach_frame(doc, frame, paragraph_index: int):
+        """Re-anchor a frame at the start of the given paragraph."""
+        text = doc.getText()
+        cursor = text.createTextCursor()
+        cursor.gotoStart(False)
+        for _ in range(paragraph_index):
+            if not cursor.gotoNextParagraph(False):
+                break
+        frame.attach(cursor)
+
+    def _frame_updates(self, frame, width_mm: int = None,
+                       height_mm: int = None, anchor_type: int = None,
+                       hori_orient: int = None, vert_orient: int = None,
+                       hori_pos_mm: int = None, vert_pos_mm: int = None,
+                       wrap: int = None
+                       ) -> Tuple[Dict[str, Any], List[str]]:
+        """Property updates and (field, value) changes for a frame."""
+        changed = []
+        updates = {}
+
+        if width_mm is not None or height_mm is not None:
+            size = frame.getPropertyValue("Size")
+            if width_mm is not None:
+                size.Width = width_mm * 100
+            if height_mm is not None:
+                size.Height = height_mm * 100
+            updates["Size"] = size
+            changed.append(
+                ("size_mm", (size.Width // 100, size.Height // 100)))
+
+        if anchor_type is not None:
+            updates["AnchorType"] = anchor_type
+            changed.append(("anchor_type", anchor_type))
+
+        if hori_orient is not None:
+            updates["HoriOrient"] = hori_orient
+            changed.append(("hori_orient", hori_orient))
+
+        if vert_orient is not None:
+            updates["VertOrient"] = vert_orient
+            changed.append(("vert_orient", vert_orient))
+
+        if hori_pos_mm is not None:
+            updates["HoriOrientPosition"] = hori_pos_mm * 100
+            changed.append(("hori_pos_mm", hori_pos_mm))
+
+        if vert_pos_mm is not None:
+            updates["VertOrientPosition"] = vert_pos_mm * 100
+            changed.append(("vert_pos_mm", vert_pos_mm))
+
+        if wrap is not None:
+            updates[self._wrap_prop(frame)] = wrap
+            changed.append(("wrap", wrap))
+
+        return updates, changed
+
+    def set_text_frames_properties(self, updates: List[Dict[str, Any]],
+                                   file_path: str = None,
+                                   verbose: bool = False) -> Dict[str, Any]:
+        """Apply set_text_frame_properties to several frames, saving once.
+
+        Each entry holds frame_name plus any set_text_frame_properties
+        field. Errors are reported per entry; changes are raw
+        [field, value] pairs unless verbose.
+        """
+        try:
+            doc = self._base.resolve_document(file_path)
+            frames_access = doc.getTextFrames()
+            available = set(frames_access.getElementNames())
+            results = []
+            applied = 0
+            with self._base.suspend_view(doc):
+                for spec in updates:
+                    name = spec.get("frame_name")
+                    if name not in available:
+                        results.append({"success": False, "frame": name,
+                                        "error": f"Frame '{name}' not found"})
+                        continue
+                    error = _unknown_fields(spec, _FRAME_UPDATE_FIELDS,
+                                            "frame_name", "paragraph_index")
+                    if error:
+                        results.append({"success": False, "frame": name,
+                                        "error": error})
+                        continue
+                    try:
+                        frame = frames_access.getByName(name)
+                        props, changed = self._frame_updates(frame, **{
+                            k: v for k, v in spec.items()
+                            if k in _FRAME_UPDATE_FIELDS})
+                        self._base.set_properties(frame, props)
+                        pidx = spec.get("paragraph_index")
+                        if pidx is not None:
+                            self._attach_frame(doc, frame, pidx)
+                            changed.append(("paragraph_index", pidx))
+                        applied += 1
+                        if verbose:
+                            changed = _format_changes(changed)
+                        results.append({"success": True, "frame": name,
+                                        "changes": changed})
+                    except Exception as e:
+                        results.append({"success": False, "frame": name,
+                                        "error": str(e)})
+
+            if applied and self._base.has_location(doc):
+                self._base.store_doc(doc)
+
+            return {"success": applied == len(results),
+                    "updated": applied, "results": results}
         except Exception as e:
             return {"success": False, "error": str(e)}
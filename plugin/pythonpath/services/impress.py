@@ -8,6 +8,53 @@ from typing import Any, Dict
 logger = logging.getLogger(__name__)
 
 
+def _shape_text(shape) -> str:
+    """Text of a shape, '' for shapes without text.
+
+    One bridge call: getString() is attempted directly instead of
+    probing for it with hasattr() first.
+    """
+    try:
+        return shape.getString()
+    except AttributeError:
+        return ""
+
+
+# Placeholders a title is taken from, in the order met on the slide
+_TITLE_SHAPES = (
+    "com.sun.star.presentation.TitleTextShape",
+    "com.sun.star.presentation.OutlinerShape",
+)
+
+
+def _slide_title(page) -> str:
+    """Slide title (first 100 chars).
+
+    Shapes are visited by index and the first non-empty title or
+    outliner placeholder wins, so the usual slide costs two calls per
+    shape up to its title. Other shapes' text is only read when no
+    placeholder has any.
+    """
+    others = []
+    for s in range(page.getCount()):
+        shape = page.getByIndex(s)
+        try:
+            is_placeholder = shape.getShapeType() in _TITLE_SHAPES
+        except Exception:
+            is_placeholder = False
+        if not is_placeholder:
+            others.append(shape)
+            continue
+        txt = _shape_text(shape).strip()
+        if txt:
+            return txt[:100]
+    for shape in others:
+        txt = _shape_text(shape).strip()
+        if txt:
+            return txt[:100]
+    return ""
+
+
 class ImpressService:
     """Presentation slide operations via UNO."""
 
@@ -15,8 +62,13 @@ class ImpressService:
         self._registry = registry
         self._base = registry.base
 
-    def list_slides(self, file_path: str = None) -> Dict[str, Any]:
-        """List slides: count, titles, layout names."""
+    def list_slides(self, start_index: int = 0, max_slides: int = None,
+                    file_path: str = None) -> Dict[str, Any]:
+        """List slides: count, titles, layout names.
+
+        Only slides in [start_index, start_index + max_slides) are
+        walked; "count" is always the deck's total.
+        """
         try:
             doc = self._base.resolve_document(file_path)
             if not self._base.is_impress(doc):
@@ -25,31 +77,27 @@ class ImpressService:
 
             pages = doc.getDrawPages()
             count = pages.getCount()
+            start = max(start_index or 0, 0)
+            stop = count if max_slides is None else min(
+                count, start + max(max_slides, 0))
             slides = []
-            for i in range(count):
+            for i in range(start, stop):
                 page = pages.getByIndex(i)
-                name = (page.Name if hasattr(page, 'Name')
-                        else f"Slide {i + 1}")
+                name = getattr(page, 'Name', None) or f"Slide {i + 1}"
                 layout = ""
                 try:
                     layout = str(page.Layout)
                 except Exception:
                     pass
-                title = ""
-                for s in range(page.getCount()):
-                    shape = page.getByIndex(s)
-                    if hasattr(shape, 'getString'):
-                        txt = shape.getString().strip()
-                        if txt:
-                            title = txt[:100]
-                            break
+                title = _slide_title(page)
                 slides.append({
                     "index": i,
                     "name": name,
                     "layout": layout,
                     "title": title,
                 })
-            return {"success": True, "slides": slides, "count": count}
+            return {"success": True, "slides": slides, "count": count,
+                    "start_index": start, "returned": len(slides)}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -71,28 +119,24 @@ class ImpressService:
             page = pages.getByIndex(slide_index)
             texts = []
             for s in range(page.getCount()):
-                shape = page.getByIndex(s)
-                if hasattr(shape, 'getString'):
-                    txt = shape.getString()
-                    if txt.strip():
-                        texts.append(txt)
+                txt = _shape_text(page.getByIndex(s))
+                if txt.strip():
+                    texts.append(txt)
 
             notes_text = ""
             try:
                 notes_page = page.getNotesPage()
                 for s in range(notes_page.getCount()):
-                    shape = notes_page.getByIndex(s)
-                    if hasattr(shape, 'getString'):
-                        txt = shape.getString().strip()
-                        if txt:
-                            notes_text += txt + "\n"
+                    txt = _shape_text(notes_page.getByIndex(s)).strip()
+                    if txt:
+                        notes_text += txt + "\n"
             except Exception:
                 pass
 
             return {
                 "success": True,
                 "slide_index": slide_index,
-                "name": page.Name if hasattr(page, 'Name') else "",
+                "name": getattr(page, 'Name', ""),
                 "texts": texts,
                 "notes": notes_text.strip(),
             }
@@ -122,8 +166,7 @@ class ImpressService:
             for i in range(masters.getCount()):
                 mp = masters.getByIndex(i)
                 master_names.append(
-                    mp.Name if hasattr(mp, 'Name')
-                    else f"Master {i + 1}")
+                    getattr(mp, 'Name', None) or f"Master {i + 1}")
 
             return {
                 "success": True,
@@ -3,7 +3,7 @@ StyleService — style listing and introspection.
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +14,20 @@ class StyleService:
     def __init__(self, registry):
         self._registry = registry
         self._base = registry.base
+        # (doc_key, family) → styles. Agents often list the same family
+        # several times in a row; any document change, GUI edits
+        # included, drops the entry through the modify listener
+        # (BaseService.watch_document → WriterService.invalidate_caches).
+        self._style_cache: Dict[Tuple[str, str], List[Dict]] = {}
+
+    def invalidate_cache(self, doc=None):
+        """Clear cached style lists (all or for a specific document)."""
+        if doc is None:
+            self._style_cache.clear()
+        else:
+            key = self._base.doc_key(doc)
+            for k in [k for k in self._style_cache if k[0] == key]:
+                del self._style_cache[k]
 
     def list_styles(self, family: str = "ParagraphStyles",
                     file_path: str = None) -> Dict[str, Any]:
@@ -28,6 +42,12 @@ class StyleService:
                         "error": f"Unknown style family: {family}",
                         "available_families": available}
 
+            cache_key = (self._base.doc_key(doc), family)
+            styles = self._style_cache.get(cache_key)
+            if styles is not None:
+                return {"success": True, "family": family,
+                        "styles": styles, "count": len(styles)}
+
             style_family = families.getByName(family)
             styles = []
             for name in style_family.getElementNames():
@@ -37,12 +57,12 @@ class StyleService:
                     "is_user_defined": style.isUserDefined(),
                     "is_in_use": style.isInUse(),
                 }
-                try:
-                    entry["parent_style"] = style.getPropertyValue(
-                        "ParentStyle")
-                except Exception:
-                    pass
+                parent = self._base.get_properties(
+                    style, ("ParentStyle",)).get("ParentStyle")
+                if parent is not None:
+                    entry["parent_style"] = parent
                 styles.append(entry)
+            self._style_cache[cache_key] = styles
 
             return {"success": True, "family": family,
                     "styles": styles, "count": len(styles)}
@@ -83,12 +103,8 @@ class StyleService:
                 ],
             }
 
-            for prop_name in props_to_read.get(family, []):
-                try:
-                    val = style.getPropertyValue(prop_name)
-                    info[prop_name] = val
-                except Exception:
-                    pass
+            info.update(self._base.get_properties(
+                style, props_to_read.get(family, [])))
 
             return {"success": True, **info}
         except Exception as e:
@@ -3,10 +3,20 @@ TableService — Writer table operations.
 """
 
 import logging
-from typing import Any, Dict
+import re
+from typing import Any, Dict, Iterator, List, Tuple
+
+from .base import column_name, parse_cell_address
 
 logger = logging.getLogger(__name__)
 
+# Plain decimal numbers; anything else is written as text in auto mode
+_NUMBER_RE = re.compile(r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
+_VALUE_TYPES = ("auto", "string", "number")
+
+
+_COL_NAMES = tuple(column_name(i) for i in range(1024))
+
 
 class TableService:
     """Writer table operations via UNO."""
@@ -15,6 +25,43 @@ class TableService:
         self._registry = registry
         self._base = registry.base
 
+    @staticmethod
+    def _parse_cell(cell: str) -> Tuple[int, int]:
+        """'B3' → (col, row), both 0-based. Raises ValueError."""
+        sheet_name, col, row = parse_cell_address(cell)
+        if sheet_name is not None:  # no sheet prefix in Writer tables
+            raise ValueError(f"Invalid cell address: {cell}")
+        return col, row
+
+    @staticmethod
+    def _coerce_value(value, value_type: str = "auto"):
+        """float for numeric cells, str otherwise (per value_type)."""
+        if value_type == "string":
+            return str(value)
+        text = str(value).strip()
+        if value_type == "number" or _NUMBER_RE.match(text):
+            return float(text)
+        return str(value)
+
+    @staticmethod
+    def _set_cell(cell_obj, value):
+        if isinstance(value, float):
+            cell_obj.setValue(value)
+        else:
+            cell_obj.setString(value)
+
+    @staticmethod
+    def _iter_tables(doc) -> Iterator[Dict[str, Any]]:
+        """Yield {name, rows, cols} for each text table."""
+        tables_sup = doc.getTextTables()
+        for name in tables_sup.getElementNames():
+            table = tables_sup.getByName(name)
+            yield {
+                "name": name,
+                "rows": table.getRows().getCount(),
+                "cols": table.getColumns().getCount(),
+            }
+
     def list_tables(self, file_path: str = None) -> Dict[str, Any]:
         """List all text tables in the document."""
         try:
@@ -23,17 +70,7 @@ class TableService:
                 return {"success": False,
                         "error": "Document does not support text tables"}
 
-            tables_sup = doc.getTextTables()
-            tables = []
-            for name in tables_sup.getElementNames():
-                table = tables_sup.getByName(name)
-                rows = table.getRows().getCount()
-                cols = table.getColumns().getCount()
-                tables.append({
-                    "name": name,
-                    "rows": rows,
-                    "cols": cols,
-                })
+            tables = list(self._iter_tables(doc))
             return {"success": True, "tables": tables,
                     "count": len(tables)}
         except Exception as e:
@@ -55,19 +92,30 @@ class TableService:
             rows = table.getRows().getCount()
             cols = table.getColumns().getCount()
 
-            data = []
-            for r in range(rows):
-                row_data = []
-                for c in range(cols):
-                    col_letter = (chr(ord('A') + c) if c < 26
-                                  else f"A{chr(ord('A') + c - 26)}")
-                    cell_name = f"{col_letter}{r + 1}"
-                    try:
-                        cell = table.getCellByName(cell_name)
-                        row_data.append(cell.getString())
-                    except Exception:
-                        row_data.append("")
-                data.append(row_data)
+            try:
+                # One round-trip for the whole grid; numbers come back
+                # as floats, so only those cells re-read their text
+                data = [
+                    [v if isinstance(v, str)
+                     else table.getCellByPosition(c, r).getString()
+                     for c, v in enumerate(row)]
+                    for r, row in enumerate(table.getDataArray())
+                ]
+            except Exception:
+                # Merged cells: no rectangular data array, read by name
+                col_names = (_COL_NAMES[:cols] if cols <= len(_COL_NAMES)
+                             else [column_name(c) for c in range(cols)])
+                data = []
+                for r in range(rows):
+                    row_data = []
+                    for c in range(cols):
+                        cell_name = f"{col_names[c]}{r + 1}"
+                        try:
+                            cell = table.getCellByName(cell_name)
+                            row_data.append(cell.getString())
+                        except Exception:
+                            row_data.append("")
+                    data.append(row_data)
 
             return {"success": True, "table_name": table_name,
                     "rows": rows, "cols": cols, "data": data}
@@ -75,9 +123,17 @@ class TableService:
             return {"success": False, "error": str(e)}
 
     def write_table_cell(self, table_name: str, cell: str, value: str,
+                         value_type: str = "auto",
                          file_path: str = None) -> Dict[str, Any]:
-        """Write to a cell in a Writer table."""
+        """Write to a cell in a Writer table.
+
+        value_type: 'auto' (numbers detected), 'string' or 'number'.
+        """
         try:
+            if value_type not in _VALUE_TYPES:
+                return {"success": False,
+                        "error": f"Invalid value_type: {value_type}. "
+                                 f"Use: {', '.join(_VALUE_TYPES)}"}
             doc = self._base.resolve_document(file_path)
             tables_sup = doc.getTextTables()
 
@@ -91,19 +147,84 @@ class TableService:
                 return {"success": False,
                         "error": f"Cell '{cell}' not found in {table_name}"}
 
-            try:
-                cell_obj.setValue(float(value))
-            except (ValueError, TypeError):
-                cell_obj.setString(value)
+            with self._base.suspend_view(doc):
+                self._set_cell(
+                    cell_obj, self._coerce_value(value, value_type))
 
-            if doc.hasLocation():
-                self._base.store_doc(doc)
+            if self._base.has_location(doc):
+                self._base.schedule_store(doc)
 
             return {"success": True, "table": table_name,
                     "cell": cell, "value": value}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def write_table_cells(self, table_name: str, cells: List[Dict],
+                          value_type: str = "auto",
+                          file_path: str = None) -> Dict[str, Any]:
+        """Write many cells of a Writer table with a single save.
+
+        cells: list of {cell, value}. When they fill a rectangle the
+        block is written with one setDataArray() call, otherwise cell
+        by cell.
+        """
+        try:
+            if value_type not in _VALUE_TYPES:
+                return {"success": False,
+                        "error": f"Invalid value_type: {value_type}. "
+                                 f"Use: {', '.join(_VALUE_TYPES)}"}
+            if not cells:
+                return {"success": False, "error": "No cells to write"}
+
+            # Validate every entry before touching the document
+            updates = {}
+            for i, item in enumerate(cells):
+                if not isinstance(item, dict) or "cell" not in item:
+                    return {"success": False,
+                            "error": f"Entry {i} has no 'cell'"}
+                try:
+                    pos = self._parse_cell(str(item["cell"]))
+                    updates[pos] = self._coerce_value(
+                        item.get("value", ""), value_type)
+                except ValueError as e:
+                    return {"success": False, "error": f"Entry {i}: {e}"}
+
+            doc = self._base.resolve_document(file_path)
+            tables_sup = doc.getTextTables()
+
+            if not tables_sup.hasByName(table_name):
+                return {"success": False,
+                        "error": f"Table '{table_name}' not found"}
+            table = tables_sup.getByName(table_name)
+
+            cols = [c for c, _ in updates]
+            rows = [r for _, r in updates]
+            c0, c1, r0, r1 = min(cols), max(cols), min(rows), max(rows)
+            written = False
+            if len(updates) == (c1 - c0 + 1) * (r1 - r0 + 1):
+                try:
+                    block = table.getCellRangeByPosition(c0, r0, c1, r1)
+                    block.setDataArray(tuple(
+                        tuple(updates[(c, r)] for c in range(c0, c1 + 1))
+                        for r in range(r0, r1 + 1)))
+                    written = True
+                except Exception:
+                    pass  # merged cells — fall back to per-cell writes
+            if not written:
+                with self._base.suspend_view(doc):
+                    for (c, r), value in updates.items():
+                        self._set_cell(
+                            table.getCellByPosition(c, r), value)
+
+            if self._base.has_location(doc):
+                self._base.store_doc(doc)
+
+            return {"success": True, "table": table_name,
+                    "written": len(updates),
+                    "block": written}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
     def create_table(self, rows: int, cols: int,
                      paragraph_index: int = None,
                      locator: str = None,
@@ -129,12 +250,14 @@ class TableService:
             table.initialize(rows, cols)
             doc_text = doc.getText()
             cursor = doc_text.createTextCursorByRange(target.getEnd())
-            doc_text.insertTextContent(cursor, table, False)
+            with self._base.suspend_view(doc):
+                doc_text.insertTextContent(cursor, table, False)
 
             table_name = table.getName()
+            self._registry.writer.invalidate_caches(doc)
 
-            if doc.hasLocation():
-                self._base.store_doc(doc)
+            if self._base.has_location(doc):
+                self._base.schedule_store(doc)
 
             return {"success": True, "table_name": table_name,
                     "rows": rows, "cols": cols}
@@ -6,6 +6,7 @@ shared helpers used across sub-services.
 """
 
 import logging
+from itertools import islice
 from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
@@ -25,6 +26,8 @@ class WriterService:
     def __init__(self, registry):
         self._registry = registry
         self._base = registry.base
+        # (id(para_ranges), index) of the last find_paragraph_for_range hit
+        self._last_para_hit = (None, -1)
 
         from .tree import TreeService
         from .paragraphs import ParagraphService
@@ -46,23 +49,51 @@ class WriterService:
     # Shared helpers (used across sub-services)
     # ==================================================================
 
+    @staticmethod
+    def outline_level(element) -> Optional[int]:
+        """OutlineLevel of a body element, or None if not a paragraph.
+
+        One property read instead of supportsService(): tables have
+        no OutlineLevel and raise, paragraphs return 0 (body) or 1..10.
+        """
+        try:
+            return element.getPropertyValue("OutlineLevel")
+        except Exception:
+            return None
+
     def get_paragraph_ranges(self, doc) -> List[Any]:
-        """Get list of paragraph elements for range comparison."""
-        text = doc.getText()
-        enum = text.createEnumeration()
-        ranges = []
-        while enum.hasMoreElements():
-            ranges.append(enum.nextElement())
-            self._base.yield_to_gui()
-        return ranges
+        """Get list of paragraph elements for range comparison.
+
+        Served from the tree's per-document paragraph snapshot, so
+        repeated calls between edits cost no enumeration. Read-only.
+        """
+        return self.tree._snapshot_paragraphs(doc).elements
 
     def find_paragraph_for_range(self, match_range, para_ranges: List,
-                                 text_obj=None) -> int:
-        """Find which paragraph index a text range belongs to."""
+                                 text_obj=None, default=0) -> Optional[int]:
+        """Find which paragraph index a text range belongs to.
+
+        Lookups usually walk the document in order (search hits,
+        annotations), so the last hit and its successor are tried
+        first; then a binary search on paragraph starts, then a
+        linear scan. Returns ``default`` when no paragraph matches.
+        """
         try:
             if text_obj is None:
                 text_obj = match_range.getText()
             match_start = match_range.getStart()
+            list_id, last = self._last_para_hit
+            if list_id == id(para_ranges):
+                for i in (last, last + 1):
+                    if 0 <= i < len(para_ranges) and self._range_in_para(
+                            text_obj, match_start, para_ranges[i]):
+                        self._last_para_hit = (list_id, i)
+                        return i
+            found = self._bisect_paragraph(
+                text_obj, match_start, para_ranges)
+            if found is not None:
+                self._last_para_hit = (id(para_ranges), found)
+                return found
             for i, para in enumerate(para_ranges):
                 try:
                     para_start = para.getStart()
@@ -77,20 +108,91 @@ class WriterService:
                     continue
         except Exception:
             pass
-        return 0
+        return default
+
+    @staticmethod
+    def _range_in_para(text_obj, match_start, para) -> bool:
+        """True if match_start lies within the paragraph's range."""
+        try:
+            return (text_obj.compareRegionStarts(
+                        match_start, para.getStart()) <= 0
+                    and text_obj.compareRegionStarts(
+                        match_start, para.getEnd()) >= 0)
+        except Exception:
+            return False
+
+    @staticmethod
+    def _bisect_paragraph(text_obj, match_start,
+                          para_ranges: List) -> Optional[int]:
+        """Last paragraph starting at/before match_start, if it contains it.
+
+        Elements without a comparable start (tables) are skipped by
+        probing leftwards. Returns None when undecided.
+        """
+        lo, hi = 0, len(para_ranges)
+        candidate = None
+        while lo < hi:
+            mid = (lo + hi) // 2
+            probe, cmp = mid, None
+            while probe >= lo:
+                try:
+                    cmp = text_obj.compareRegionStarts(
+                        match_start, para_ranges[probe].getStart())
+                    break
+                except Exception:
+                    probe -= 1
+            if cmp is None:
+                lo = mid + 1
+            elif cmp <= 0:
+                candidate = probe
+                lo = probe + 1
+            else:
+                hi = probe
+        if candidate is None:
+            return None
+        try:
+            if text_obj.compareRegionStarts(
+                    match_start, para_ranges[candidate].getEnd()) >= 0:
+                return candidate
+        except Exception:
+            pass
+        return None
 
     def find_paragraph_element(self, doc, para_index: int):
-        """Find a paragraph element by index. Returns (element, max_index)."""
-        doc_text = doc.getText()
-        enum = doc_text.createEnumeration()
+        """Find a paragraph element by index. Returns (element, max_index).
+
+        Direct lookup in the cached paragraph snapshot, which the
+        document's modify listener (BaseService.watch_document) drops
+        on any change, GUI edits included; during a batch (caches not
+        invalidated per edit) walk the enumeration instead.
+        """
+        if not self._registry.batch_mode:
+            elements = self.tree._snapshot_paragraphs(doc).elements
+            if 0 <= para_index < len(elements):
+                return elements[para_index], para_index
+            return None, len(elements)
         idx = 0
-        while enum.hasMoreElements():
-            element = enum.nextElement()
+        for element in self._base.iter_enum(
+                doc.getText().createEnumeration()):
             if idx == para_index:
                 return element, idx
             idx += 1
         return None, idx
 
+    def find_paragraph_elements(self, doc, start: int,
+                                count: int) -> List[Any]:
+        """Body elements [start, start + count), resolved like
+        find_paragraph_element: sliced from the snapshot, or from a
+        walk of the enumeration during a batch.
+        """
+        if start < 0 or count <= 0:
+            return []
+        if not self._registry.batch_mode:
+            elements = self.tree._snapshot_paragraphs(doc).elements
+            return elements[start:start + count]
+        return list(islice(self._base.iter_enum(
+            doc.getText().createEnumeration()), start, start + count))
+
     def extract_table_info(self, table) -> Dict[str, Any]:
         """Extract basic info from a TextTable element."""
         try:
@@ -108,6 +210,9 @@ class WriterService:
         self.tree.invalidate_cache(doc)
         self.proximity.invalidate_cache(doc)
         self.index.invalidate_cache(doc)
+        self._registry.comments.invalidate_cache(doc)
+        self._registry.styles.invalidate_cache(doc)
+        self._registry.images.invalidate_cache(doc)
         self._base.invalidate_page_cache()
 
     # ==================================================================
@@ -121,6 +226,9 @@ class WriterService:
     def get_heading_children(self, *a, **kw):
         return self.tree.get_heading_children(*a, **kw)
 
+    def get_document_overview(self, *a, **kw):
+        return self.tree.get_document_overview(*a, **kw)
+
     # -- Paragraph reading --
     def get_paragraph_count(self, *a, **kw):
         return self.paragraphs.get_paragraph_count(*a, **kw)
@@ -335,12 +335,12 @@ class IndexService:
         idx.language = lang
         text_obj = doc.getText()
         enum = text_obj.createEnumeration()
+        outline_level = self._writer.outline_level
         para_i = 0
 
-        while enum.hasMoreElements():
-            el = enum.nextElement()
+        for el in self._base.iter_enum(enum):
             idx.para_elements.append(el)
-            if el.supportsService("com.sun.star.text.Paragraph"):
+            if outline_level(el) is not None:
                 text = el.getString()
                 idx.para_texts[para_i] = text
                 raw = _raw_tokens(text)
@@ -6,6 +6,7 @@ Reading, inserting, deleting, modifying paragraph text and style.
 
 import logging
 import uuid
+from itertools import islice
 from typing import Any, Dict, Optional
 
 from com.sun.star.text.ControlCharacter import PARAGRAPH_BREAK
@@ -90,18 +91,12 @@ class ParagraphService:
     # ==================================================================
 
     def get_paragraph_count(self, file_path: str = None) -> Dict[str, Any]:
-        try:
-            doc = self._base.resolve_document(file_path)
-            text = doc.getText()
-            enum = text.createEnumeration()
-            count = 0
-            while enum.hasMoreElements():
-                para = enum.nextElement()
-                if para.supportsService("com.sun.star.text.Paragraph"):
-                    count += 1
-            return {"success": True, "paragraph_count": count}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        result = self._writer.tree.get_document_overview(
+            file_path, ("count",))
+        if not result.get("success"):
+            return result
+        return {"success": True,
+                "paragraph_count": result["paragraph_count"]}
 
     def read_paragraphs(self, start_index: int = None, count: int = 10,
                         locator: str = None,
@@ -113,52 +108,49 @@ class ParagraphService:
                 start_index = resolved.get("para_index", 0)
             if start_index is None:
                 start_index = 0
+            # Same window as before: [start, start + count) clipped at 0
+            end_index = start_index + count
+            start_index = max(start_index, 0)
+            end_index = max(end_index, start_index)
 
-            text = doc.getText()
-            enum = text.createEnumeration()
+            elements = self._base.iter_enum(
+                doc.getText().createEnumeration())
             bookmark_map = self._writer.tree.get_mcp_bookmark_map(doc)
             paragraphs = []
-            current_index = 0
-            end_index = start_index + count
 
-            while enum.hasMoreElements() and current_index < end_index:
-                element = enum.nextElement()
-                if current_index >= start_index:
-                    if element.supportsService(
-                            "com.sun.star.text.Paragraph"):
-                        style_name = ""
-                        outline_level = 0
-                        try:
-                            style_name = element.getPropertyValue(
-                                "ParaStyleName")
-                            outline_level = element.getPropertyValue(
-                                "OutlineLevel")
-                        except Exception:
-                            pass
-                        entry = {
-                            "index": current_index,
-                            "text": element.getString(),
-                            "style_name": style_name,
-                            "outline_level": outline_level,
-                            "is_table": False,
-                        }
-                        if current_index in bookmark_map:
-                            entry["bookmark"] = bookmark_map[current_index]
-                        paragraphs.append(entry)
-                    elif element.supportsService(
-                            "com.sun.star.text.TextTable"):
-                        info = self._writer.extract_table_info(element)
-                        paragraphs.append({
-                            "index": current_index,
-                            "text": f"[Table: {info.get('name', '?')}, "
-                                    f"{info.get('rows', '?')}x"
-                                    f"{info.get('cols', '?')}]",
-                            "style_name": "",
-                            "outline_level": 0,
-                            "is_table": True,
-                            "table_info": info,
-                        })
-                current_index += 1
+            for current_index, element in enumerate(
+                    islice(elements, start_index, end_index),
+                    start=start_index):
+                outline_level = self._writer.outline_level(element)
+                if outline_level is not None:
+                    style_name = ""
+                    try:
+                        style_name = element.getPropertyValue(
+                            "ParaStyleName")
+                    except Exception:
+                        pass
+                    entry = {
+                        "index": current_index,
+                        "text": element.getString(),
+                        "style_name": style_name,
+                        "outline_level": outline_level,
+                        "is_table": False,
+                    }
+                    if current_index in bookmark_map:
+                        entry["bookmark"] = bookmark_map[current_index]
+                    paragraphs.append(entry)
+                else:
+                    info = self._writer.extract_table_info(element)
+                    paragraphs.append({
+                        "index": current_index,
+                        "text": f"[Table: {info.get('name', '?')}, "
+                                f"{info.get('rows', '?')}x"
+                                f"{info.get('cols', '?')}]",
+                        "style_name": "",
+                        "outline_level": 0,
+                        "is_table": True,
+                        "table_info": info,
+                    })
                 self._base.yield_to_gui()
 
             return {
@@ -166,7 +158,7 @@ class ParagraphService:
                 "paragraphs": paragraphs,
                 "start_index": start_index,
                 "count_returned": len(paragraphs),
-                "has_more": enum.hasMoreElements(),
+                "has_more": next(elements, None) is not None,
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -240,8 +232,8 @@ class ParagraphService:
             bm_name = self._create_bookmark(doc, cursor)
 
             self._writer.invalidate_caches(doc)
-            if doc.hasLocation():
-                self._base.store_doc(doc)
+            if self._base.has_location(doc):
+                self._base.schedule_store(doc)
 
             result = {"success": True,
                       "paragraph_index": new_para_index,
@@ -333,7 +325,7 @@ class ParagraphService:
             bm_name = self._create_bookmark(doc, cursor)
 
             self._writer.invalidate_caches(doc)
-            if doc.hasLocation():
+            if self._base.has_location(doc):
                 self._base.store_doc(doc)
 
             result = {"success": True,
@@ -360,16 +352,8 @@ class ParagraphService:
                         "error": "Provide locator or paragraph_index"}
 
             doc_text = doc.getText()
-            enum = doc_text.createEnumeration()
-            idx = 0
-            target = None
-            while enum.hasMoreElements():
-                element = enum.nextElement()
-                if idx == paragraph_index:
-                    target = element
-                    break
-                idx += 1
-
+            target, _ = self._writer.find_paragraph_element(
+                doc, paragraph_index)
             if target is None:
                 return {"success": False,
                         "error": f"Paragraph {paragraph_index} not found"}
@@ -383,13 +367,15 @@ class ParagraphService:
             cursor = doc_text.createTextCursorByRange(target)
             cursor.gotoStartOfParagraph(False)
             cursor.gotoEndOfParagraph(True)
-            if enum.hasMoreElements():
+            following, _ = self._writer.find_paragraph_element(
+                doc, paragraph_index + 1)
+            if following is not None:
                 cursor.goRight(1, True)
             cursor.setString("")
 
             self._writer.invalidate_caches(doc)
-            if doc.hasLocation():
-                self._base.store_doc(doc)
+            if self._base.has_location(doc):
+                self._base.schedule_store(doc)
 
             return {"success": True,
                     "message": f"Deleted paragraph {paragraph_index}"}
@@ -425,8 +411,8 @@ class ParagraphService:
             target.setString(text)
 
             self._writer.invalidate_caches(doc)
-            if doc.hasLocation():
-                self._base.store_doc(doc)
+            if self._base.has_location(doc):
+                self._base.schedule_store(doc)
 
             result = {"success": True, "paragraph_index": paragraph_index,
                       "old_length": len(old_text), "new_length": len(text)}
@@ -467,8 +453,8 @@ class ParagraphService:
             target.setPropertyValue("ParaStyleName", style_name)
 
             self._writer.invalidate_caches(doc)
-            if doc.hasLocation():
-                self._base.store_doc(doc)
+            if self._base.has_location(doc):
+                self._base.schedule_store(doc)
 
             result = {"success": True, "paragraph_index": paragraph_index,
                       "old_style": old_style, "new_style": style_name}
@@ -493,39 +479,40 @@ class ParagraphService:
                         "error": "Provide locator or paragraph_index"}
 
             doc_text = doc.getText()
-            enum = doc_text.createEnumeration()
-            elements = []
-            idx = 0
-            while enum.hasMoreElements():
-                el = enum.nextElement()
-                if paragraph_index <= idx < paragraph_index + count:
-                    elements.append(el)
-                if idx >= paragraph_index + count - 1:
-                    break
-                idx += 1
+            elements = self._writer.find_paragraph_elements(
+                doc, paragraph_index, count)
 
             if not elements:
                 return {"success": False,
                         "error": f"Paragraph {paragraph_index} not found"}
 
-            last = elements[-1]
-            cursor = doc_text.createTextCursorByRange(last)
+            texts = [el.getString() for el in elements]
+            styles = [el.getPropertyValue("ParaStyleName")
+                      for el in elements]
+            cursor = doc_text.createTextCursorByRange(elements[-1])
             cursor.gotoEndOfParagraph(False)
 
-            for el in elements:
-                txt = el.getString()
-                sty = el.getPropertyValue("ParaStyleName")
+            # Writer splits insertString() text at each CR, and every
+            # split paragraph keeps the style of the last source one.
+            # So: one break, one insert, then walk back from the end
+            # and restyle only the copies whose style differs.
+            inherited = styles[-1]
+            restyle = [i for i, sty in enumerate(styles) if sty != inherited]
+            with self._base.suspend_view(doc):
                 doc_text.insertControlCharacter(
                     cursor, PARAGRAPH_BREAK, False)
-                doc_text.insertString(cursor, txt, False)
-                cursor.gotoStartOfParagraph(False)
-                cursor.gotoEndOfParagraph(True)
-                cursor.setPropertyValue("ParaStyleName", sty)
-                cursor.gotoEndOfParagraph(False)
+                doc_text.insertString(cursor, "\r".join(texts), False)
+                if restyle:
+                    for i in range(len(styles) - 1, restyle[0] - 1, -1):
+                        if i < len(styles) - 1:
+                            cursor.gotoPreviousParagraph(False)
+                        if styles[i] != inherited:
+                            cursor.setPropertyValue(
+                                "ParaStyleName", styles[i])
 
             self._writer.invalidate_caches(doc)
-            if doc.hasLocation():
-                self._base.store_doc(doc)
+            if self._base.has_location(doc):
+                self._base.schedule_store(doc)
 
             return {"success": True,
                     "message": f"Duplicated {count} paragraph(s) "
@@ -354,14 +354,9 @@ class ProximityService:
                 paragraphs = []
                 for i in range(start_idx, end_idx + 1):
                     el = para_ranges[i]
-                    if not el.supportsService(
-                            "com.sun.star.text.Paragraph"):
+                    level = self._writer.outline_level(el)
+                    if level is None:
                         continue
-                    level = 0
-                    try:
-                        level = el.getPropertyValue("OutlineLevel")
-                    except Exception:
-                        pass
                     text = el.getString()
                     entry = {
                         "para_index": i,
@@ -65,8 +65,7 @@ class SearchService:
                 while text_enum.hasMoreElements():
                     el = text_enum.nextElement()
                     if pidx in needed_paras:
-                        if el.supportsService(
-                                "com.sun.star.text.Paragraph"):
+                        if self._writer.outline_level(el) is not None:
                             para_texts[pidx] = el.getString()
                         else:
                             para_texts[pidx] = "[Table]"
@@ -115,8 +114,8 @@ class SearchService:
 
             if count > 0:
                 self._writer.invalidate_caches(doc)
-                if doc.hasLocation():
-                    self._base.store_doc(doc)
+                if self._base.has_location(doc):
+                    self._base.schedule_store(doc)
 
             return {"success": True, "replacements_made": count,
                     "search": search, "replace": replace}
@@ -99,33 +99,30 @@ class StructuralService:
         Tries exact match first, then prefix match, then substring.
         Returns {para_index, text, level, bookmark} or None.
         """
-        tree = self._writer.tree.build_heading_tree(doc)
-        bookmark_map = self._writer.tree.get_mcp_bookmark_map(doc)
-        headings = self._flatten_headings(tree)
-
         search_lower = search_text.lower().strip()
         if not search_lower:
             return None
 
-        # Pass 1: exact match (case-insensitive)
-        for h in headings:
-            if h["text"].lower().strip() == search_lower:
-                h["bookmark"] = bookmark_map.get(h["para_index"])
-                return h
-
-        # Pass 2: prefix match
-        for h in headings:
-            if h["text"].lower().strip().startswith(search_lower):
-                h["bookmark"] = bookmark_map.get(h["para_index"])
-                return h
-
-        # Pass 3: substring match
-        for h in headings:
-            if search_lower in h["text"].lower():
-                h["bookmark"] = bookmark_map.get(h["para_index"])
-                return h
-
-        return None
+        tree = self._writer.tree.build_heading_tree(doc)
+        # One pass: an exact hit returns at once, otherwise the first
+        # prefix match wins over the first substring match.
+        prefix = substring = None
+        for h in self._flatten_headings(tree):
+            text = h["text"].lower().strip()
+            if text == search_lower:
+                found = h
+                break
+            if prefix is None and text.startswith(search_lower):
+                prefix = h
+            elif substring is None and search_lower in text:
+                substring = h
+        else:
+            found = prefix or substring
+        if found is None:
+            return None
+        found["bookmark"] = self._writer.tree.get_mcp_bookmark_map(
+            doc).get(found["para_index"])
+        return found
 
     def _flatten_headings(self, node):
         """Flatten heading tree to a list of {text, para_index, level}."""
@@ -182,14 +179,10 @@ class StructuralService:
             heading_info = {}
             if para_idx < len(para_ranges):
                 element = para_ranges[para_idx]
-                if element.supportsService(
-                        "com.sun.star.text.Paragraph"):
-                    try:
-                        heading_info["text"] = element.getString()
-                        heading_info["outline_level"] = \
-                            element.getPropertyValue("OutlineLevel")
-                    except Exception:
-                        pass
+                level = self._writer.outline_level(element)
+                if level is not None:
+                    heading_info["text"] = element.getString()
+                    heading_info["outline_level"] = level
 
             return {"success": True, "bookmark": bookmark_name,
                     "para_index": para_idx, **heading_info}
@@ -209,11 +202,12 @@ class StructuralService:
             names = supplier.getElementNames()
             sections = []
             for name in names:
-                section = supplier.getByName(name)
+                props = self._base.get_properties(
+                    supplier.getByName(name), ("IsVisible", "IsProtected"))
                 sections.append({
                     "name": name,
-                    "is_visible": getattr(section, "IsVisible", True),
-                    "is_protected": getattr(section, "IsProtected", False),
+                    "is_visible": props.get("IsVisible", True),
+                    "is_protected": props.get("IsProtected", False),
                 })
             return {"success": True, "sections": sections,
                     "count": len(sections)}
@@ -268,10 +262,21 @@ class StructuralService:
     # ==================================================================
 
     def get_page_count(self, file_path: str = None) -> Dict[str, Any]:
+        """Page count from the view's layout statistic.
+
+        The text view exposes PageCount from the current layout; the
+        view-cursor jump to the last page is kept for views without it.
+        """
         try:
             doc = self._base.resolve_document(file_path)
             controller = doc.getCurrentController()
             if controller:
+                try:
+                    return {"success": True,
+                            "page_count": controller.getPropertyValue(
+                                "PageCount")}
+                except Exception:
+                    pass
                 vc = controller.getViewCursor()
                 saved = doc.getText().createTextCursorByRange(
                     vc.getStart())
@@ -439,17 +444,28 @@ class StructuralService:
             for i in range(count):
                 idx = indexes.getByIndex(i)
                 idx.update()
-                name = (idx.getName()
-                        if hasattr(idx, "getName") else f"index_{i}")
+                try:
+                    name = idx.getName()
+                except AttributeError:
+                    name = f"index_{i}"
                 refreshed.append(name)
-            if count > 0 and doc.hasLocation():
-                self._base.store_doc(doc)
+            if count > 0:
+                # Index bodies are regenerated: cached elements are stale
+                self._writer.invalidate_caches(doc)
+            if count > 0 and self._base.has_location(doc):
+                self._base.schedule_store(doc)
             return {"success": True, "refreshed": refreshed,
                     "count": count}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def update_fields(self, file_path: str = None) -> Dict[str, Any]:
+    def update_fields(self, file_path: str = None,
+                      include_count: bool = True) -> Dict[str, Any]:
+        """Refresh all text fields.
+
+        The field collection has no getCount(), so counting means
+        enumerating every field; include_count=False skips it.
+        """
         try:
             doc = self._base.resolve_document(file_path)
             if not hasattr(doc, "getTextFields"):
@@ -457,11 +473,10 @@ class StructuralService:
                         "error": "Document does not support text fields"}
             fields = doc.getTextFields()
             fields.refresh()
-            enum = fields.createEnumeration()
-            count = 0
-            while enum.hasMoreElements():
-                enum.nextElement()
-                count += 1
+            if not include_count:
+                return {"success": True}
+            count = sum(1 for _ in self._base.iter_enum(
+                fields.createEnumeration()))
             return {"success": True, "fields_refreshed": count}
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -6,96 +6,178 @@ and AI summaries map.  Caches are invalidated by WriterService
 after any document edit.
 """
 
+import bisect
 import logging
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+class _ParagraphSnapshot:
+    """One enumeration pass over the body text.
+
+    ``levels[i]`` is the OutlineLevel of element *i* (0 for body
+    paragraphs and tables), ``is_para[i]`` tells paragraphs from tables.
+    ``heading_indices`` is the sorted list of heading positions.
+    """
+
+    __slots__ = ("elements", "levels", "is_para", "heading_indices")
+
+    def __init__(self):
+        self.elements = []         # UNO paragraph / table elements
+        self.levels = []           # int outline level per element
+        self.is_para = []          # bool per element
+        self.heading_indices = []  # sorted para indices with level > 0
+
+    def __len__(self):
+        return len(self.elements)
+
+    def next_heading_after(self, para_index: int) -> int:
+        """Index of the first heading after para_index (or len)."""
+        heads = self.heading_indices
+        pos = bisect.bisect_right(heads, para_index)
+        return heads[pos] if pos < len(heads) else len(self.elements)
+
+
 class TreeService:
     """Heading tree navigation with per-document caching."""
 
+    _PREVIEW_MAX = 100
+    _ELLIPSIS = "..."
+
     def __init__(self, writer):
         self._writer = writer
         self._base = writer._base
 
         # Per-document caches: {doc_key: value}
+        self._snapshot_cache: Dict[str, _ParagraphSnapshot] = {}
         self._tree_cache: Dict[str, Dict] = {}
-        self._bookmark_cache: Dict[str, Dict[int, str]] = {}
+        # Bookmark map is stored with its bookmark-count token
+        self._bookmark_cache: Dict[str, Tuple[int, Dict[int, str]]] = {}
+        self._heading_bookmark_cache: Dict[str, Dict[int, str]] = {}
         self._ai_summary_cache: Dict[str, Dict[int, str]] = {}
 
     def invalidate_cache(self, doc=None):
         """Clear caches (all or for a specific document)."""
         if doc is None:
+            self._snapshot_cache.clear()
             self._tree_cache.clear()
             self._bookmark_cache.clear()
+            self._heading_bookmark_cache.clear()
             self._ai_summary_cache.clear()
         else:
             key = self._base.doc_key(doc)
+            self._snapshot_cache.pop(key, None)
             self._tree_cache.pop(key, None)
             self._bookmark_cache.pop(key, None)
+            self._heading_bookmark_cache.pop(key, None)
             self._ai_summary_cache.pop(key, None)
 
+    def invalidate_bookmarks(self, doc):
+        """Drop the cached bookmark maps for one document."""
+        key = self._base.doc_key(doc)
+        self._bookmark_cache.pop(key, None)
+        self._heading_bookmark_cache.pop(key, None)
+
+    # ==================================================================
+    # Paragraph snapshot (single enumeration, shared by all walks)
+    # ==================================================================
+
+    def _snapshot_paragraphs(self, doc) -> _ParagraphSnapshot:
+        """Enumerate the body once, recording element + outline level.
+
+        The OutlineLevel read doubles as the paragraph test (tables
+        raise), so no supportsService() round-trip per element.
+        Not cached during a batch: edits there skip invalidation.
+        """
+        key = self._base.doc_key(doc)
+        batch = self._writer._registry.batch_mode
+        cached = None if batch else self._snapshot_cache.get(key)
+        if cached is not None:
+            return cached
+
+        snap = _ParagraphSnapshot()
+        outline_level = self._writer.outline_level
+        for element in self._base.iter_enum(
+                doc.getText().createEnumeration()):
+            level = outline_level(element)
+            if level:
+                snap.heading_indices.append(len(snap.elements))
+            snap.elements.append(element)
+            snap.levels.append(level or 0)
+            snap.is_para.append(level is not None)
+            self._base.yield_to_gui()
+
+        if not batch:
+            self._snapshot_cache[key] = snap
+        return snap
+
     # ==================================================================
     # Heading bookmarks (stable IDs)
     # ==================================================================
 
+    @staticmethod
+    def _bookmark_token(doc) -> Optional[int]:
+        """Cheap change marker for the bookmark set (its size)."""
+        try:
+            return doc.getBookmarks().getCount()
+        except Exception:
+            return None
+
     def get_mcp_bookmark_map(self, doc) -> Dict[int, str]:
-        """Get {para_index: bookmark_name} for all _mcp_ bookmarks."""
+        """Get {para_index: bookmark_name} for all _mcp_ bookmarks.
+
+        Cached per document; reused as long as the bookmark count is
+        unchanged (bookmarks added/removed outside MCP drop the entry).
+        """
         key = self._base.doc_key(doc)
-        if key in self._bookmark_cache:
-            return self._bookmark_cache[key]
+        token = self._bookmark_token(doc)
+        cached = self._bookmark_cache.get(key)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+        self._heading_bookmark_cache.pop(key, None)
 
         result = {}
         try:
-            if not hasattr(doc, "getBookmarks"):
-                return result
-            bookmarks = doc.getBookmarks()
-            names = bookmarks.getElementNames()
-            if not names:
-                return result
-            para_ranges = self._writer.get_paragraph_ranges(doc)
-            text_obj = doc.getText()
-            for name in names:
-                if not name.startswith("_mcp_"):
-                    continue
-                bm = bookmarks.getByName(name)
-                anchor = bm.getAnchor()
-                para_idx = self._writer.find_paragraph_for_range(
-                    anchor, para_ranges, text_obj)
-                result[para_idx] = name
+            if hasattr(doc, "getBookmarks"):
+                bookmarks = doc.getBookmarks()
+                names = [n for n in bookmarks.getElementNames()
+                         if n.startswith("_mcp_")]
+                if names:
+                    para_ranges = self._writer.get_paragraph_ranges(doc)
+                    text_obj = doc.getText()
+                    for name in names:
+                        bm = bookmarks.getByName(name)
+                        anchor = bm.getAnchor()
+                        para_idx = self._writer.find_paragraph_for_range(
+                            anchor, para_ranges, text_obj)
+                        result[para_idx] = name
         except Exception as e:
             logger.error("Failed to get MCP bookmark map: %s", e)
 
-        self._bookmark_cache[key] = result
+        self._bookmark_cache[key] = (token, result)
         return result
 
     def ensure_heading_bookmarks(self, doc) -> Dict[int, str]:
         """Ensure every heading has an _mcp_ bookmark. Returns map."""
+        key = self._base.doc_key(doc)
         existing_map = self.get_mcp_bookmark_map(doc)
+        cached = self._heading_bookmark_cache.get(key)
+        if cached is not None:
+            return cached
+
         text = doc.getText()
-        enum = text.createEnumeration()
-        para_index = 0
+        snap = self._snapshot_paragraphs(doc)
         bookmark_map = {}
         needs_bookmark = []
 
-        while enum.hasMoreElements():
-            element = enum.nextElement()
-            if element.supportsService("com.sun.star.text.Paragraph"):
-                outline_level = 0
-                try:
-                    outline_level = element.getPropertyValue("OutlineLevel")
-                except Exception:
-                    pass
-                if outline_level > 0:
-                    if para_index in existing_map:
-                        bookmark_map[para_index] = existing_map[para_index]
-                    else:
-                        needs_bookmark.append(
-                            (para_index, element.getStart()))
-            para_index += 1
-            self._base.yield_to_gui()
+        for para_index in snap.heading_indices:
+            if para_index in existing_map:
+                bookmark_map[para_index] = existing_map[para_index]
+            else:
+                needs_bookmark.append(
+                    (para_index, snap.elements[para_index].getStart()))
 
         for para_idx, start_range in needs_bookmark:
             bm_name = f"_mcp_{uuid.uuid4().hex[:8]}"
@@ -105,12 +187,14 @@ class TreeService:
             text.insertTextContent(cursor, bookmark, False)
             bookmark_map[para_idx] = bm_name
 
-        if needs_bookmark and doc.hasLocation():
-            self._base.store_doc(doc)
+        if needs_bookmark:
+            existing_map.update(bookmark_map)
+            self._bookmark_cache[key] = (
+                self._bookmark_token(doc), existing_map)
+            if self._base.has_location(doc):
+                self._base.schedule_store(doc)
 
-        # Update cache
-        key = self._base.doc_key(doc)
-        self._bookmark_cache[key] = bookmark_map
+        self._heading_bookmark_cache[key] = bookmark_map
         return bookmark_map
 
     def find_nearest_heading_bookmark(self, para_index: int,
@@ -136,44 +220,25 @@ class TreeService:
         if key in self._tree_cache:
             return self._tree_cache[key]
 
-        text = doc.getText()
-        enum = text.createEnumeration()
+        snap = self._snapshot_paragraphs(doc)
         root = {"level": 0, "text": "root", "para_index": -1,
                 "children": [], "body_paragraphs": 0}
         stack = [root]
-        para_index = 0
-
-        while enum.hasMoreElements():
-            element = enum.nextElement()
-            is_para = element.supportsService(
-                "com.sun.star.text.Paragraph")
-            is_table = element.supportsService(
-                "com.sun.star.text.TextTable")
 
-            if is_para:
-                outline_level = 0
-                try:
-                    outline_level = element.getPropertyValue("OutlineLevel")
-                except Exception:
-                    pass
-                if outline_level > 0:
-                    while (len(stack) > 1
-                           and stack[-1]["level"] >= outline_level):
-                        stack.pop()
-                    node = {"level": outline_level,
-                            "text": element.getString(),
-                            "para_index": para_index,
-                            "children": [], "body_paragraphs": 0}
-                    stack[-1]["children"].append(node)
-                    stack.append(node)
-                else:
-                    stack[-1]["body_paragraphs"] += 1
-            elif is_table:
+        for para_index, outline_level in enumerate(snap.levels):
+            if outline_level > 0:
+                while (len(stack) > 1
+                       and stack[-1]["level"] >= outline_level):
+                    stack.pop()
+                node = {"level": outline_level,
+                        "text": snap.elements[para_index].getString(),
+                        "para_index": para_index,
+                        "children": [], "body_paragraphs": 0}
+                stack[-1]["children"].append(node)
+                stack.append(node)
+            else:
                 stack[-1]["body_paragraphs"] += 1
 
-            para_index += 1
-            self._base.yield_to_gui()
-
         self._tree_cache[key] = root
         return root
 
@@ -199,68 +264,36 @@ class TreeService:
     # ==================================================================
 
     def _get_body_preview(self, doc, heading_para_index: int,
-                          max_chars: int = 100) -> str:
-        text = doc.getText()
-        enum = text.createEnumeration()
-        idx = 0
+                          max_chars: int = _PREVIEW_MAX) -> str:
+        snap = self._snapshot_paragraphs(doc)
+        end = snap.next_heading_after(heading_para_index)
         preview_parts = []
-        found_heading = (heading_para_index == -1)
-
-        while enum.hasMoreElements():
-            element = enum.nextElement()
-            is_para = element.supportsService(
-                "com.sun.star.text.Paragraph")
-            if idx == heading_para_index:
-                found_heading = True
-                idx += 1
+        total_len = 0
+
+        for idx in range(heading_para_index + 1, end):
+            if not snap.is_para[idx]:
                 continue
-            if found_heading and is_para:
-                outline_level = 0
-                try:
-                    outline_level = element.getPropertyValue("OutlineLevel")
-                except Exception:
-                    pass
-                if outline_level > 0:
+            para_text = snap.elements[idx].getString().strip()
+            if para_text:
+                preview_parts.append(para_text)
+                total_len += len(para_text)
+                if total_len >= max_chars:
                     break
-                para_text = element.getString().strip()
-                if para_text:
-                    preview_parts.append(para_text)
-                    if sum(len(p) for p in preview_parts) >= max_chars:
-                        break
-            idx += 1
 
         full_preview = " ".join(preview_parts)
-        if len(full_preview) > max_chars:
-            full_preview = full_preview[:max_chars] + "..."
-        return full_preview
+        if len(full_preview) <= max_chars:
+            return full_preview
+        return full_preview[:max_chars] + self._ELLIPSIS
 
     def _get_full_body_text(self, doc, heading_para_index: int) -> str:
-        text = doc.getText()
-        enum = text.createEnumeration()
-        idx = 0
-        parts = []
-        found_heading = (heading_para_index == -1)
-
-        while enum.hasMoreElements():
-            element = enum.nextElement()
-            is_para = element.supportsService(
-                "com.sun.star.text.Paragraph")
-            if idx == heading_para_index:
-                found_heading = True
-                idx += 1
-                continue
-            if found_heading and is_para:
-                outline_level = 0
-                try:
-                    outline_level = element.getPropertyValue("OutlineLevel")
-                except Exception:
-                    pass
-                if outline_level > 0:
-                    break
-                parts.append(element.getString())
-            idx += 1
-
-        return "\n".join(parts)
+        snap = self._snapshot_paragraphs(doc)
+        end = snap.next_heading_after(heading_para_index)
+        elements = snap.elements
+        is_para = snap.is_para
+        return "\n".join(
+            elements[idx].getString()
+            for idx in range(heading_para_index + 1, end)
+            if is_para[idx])
 
     def get_ai_summaries_map(self, doc) -> Dict[int, str]:
         """Build {para_index: summary} map from MCP-AI annotations."""
@@ -270,21 +303,8 @@ class TreeService:
 
         summaries = {}
         try:
-            fields_supplier = doc.getTextFields()
-            enum = fields_supplier.createEnumeration()
             para_ranges = self._writer.get_paragraph_ranges(doc)
-
-            while enum.hasMoreElements():
-                field = enum.nextElement()
-                if not field.supportsService(
-                        "com.sun.star.text.textfield.Annotation"):
-                    continue
-                try:
-                    author = field.getPropertyValue("Author")
-                except Exception:
-                    continue
-                if author != "MCP-AI":
-                    continue
+            for field in self._ai_annotation_fields(doc):
                 content = field.getPropertyValue("Content")
                 anchor = field.getAnchor()
                 para_idx = self._writer.find_paragraph_for_range(
@@ -299,7 +319,7 @@ class TreeService:
     def _apply_content_strategy(self, node: Dict, doc,
                                 ai_summaries: Dict[int, str],
                                 strategy: str,
-                                max_chars: int = 100):
+                                max_chars: int = _PREVIEW_MAX):
         para_idx = node.get("para_index", -1)
         if strategy == "none":
             pass
@@ -323,94 +343,143 @@ class TreeService:
                               current_depth: int = 1,
                               bookmark_map: Dict[int, str] = None
                               ) -> Dict[str, Any]:
-        node = {
-            "type": "heading",
-            "level": child["level"],
-            "text": child["text"],
-            "para_index": child["para_index"],
-            "bookmark": (bookmark_map or {}).get(child["para_index"]),
-            "children_count": self._count_all_children(child),
-            "body_paragraphs": child["body_paragraphs"],
-        }
-        self._apply_content_strategy(
-            node, doc, ai_summaries, content_strategy)
-        if depth == 0 or current_depth < depth:
-            if child.get("children"):
-                node["children"] = [
-                    self._serialize_tree_node(
-                        sub, doc, ai_summaries, content_strategy,
-                        depth, current_depth + 1, bookmark_map)
-                    for sub in child["children"]
-                ]
-        return node
+        """Serialize a heading subtree, walking it with an explicit stack."""
+        bookmark_map = bookmark_map or {}
+        root = []
+        stack = [(child, root, current_depth)]
+        while stack:
+            src, parent_list, cur = stack.pop()
+            node = {
+                "type": "heading",
+                "level": src["level"],
+                "text": src["text"],
+                "para_index": src["para_index"],
+                "bookmark": bookmark_map.get(src["para_index"]),
+                "children_count": self._count_all_children(src),
+                "body_paragraphs": src["body_paragraphs"],
+            }
+            self._apply_content_strategy(
+                node, doc, ai_summaries, content_strategy)
+            parent_list.append(node)
+            if (depth == 0 or cur < depth) and src.get("children"):
+                node["children"] = []
+                # Reversed so nodes are visited in document order
+                for sub in reversed(src["children"]):
+                    stack.append((sub, node["children"], cur + 1))
+        return root[0]
+
+    def _collect_pages(self, doc, children: List[Dict]):
+        """Stamp 'page' on heading nodes, then read the page count.
+
+        Both jobs share one view cursor and one lock/restore cycle.
+        Returns (page_count, children).
+        """
+        snap = self._snapshot_paragraphs(doc)
+        vc = doc.getCurrentController().getViewCursor()
+        saved = doc.getText().createTextCursorByRange(vc.getStart())
+        doc.lockControllers()
+        try:
+            pending = list(children)
+            while pending:
+                node = pending.pop()
+                pi = node.get("para_index")
+                if pi is not None and 0 <= pi < len(snap):
+                    try:
+                        vc.gotoRange(snap.elements[pi].getStart(), False)
+                        node["page"] = vc.getPage()
+                    except Exception:
+                        pass
+                pending.extend(node.get("children", ()))
+            vc.gotoEnd(False)
+            page_count = vc.getPage()
+        finally:
+            vc.gotoRange(saved, False)
+            doc.unlockControllers()
+        return page_count, children
 
     # ==================================================================
     # Public tree API
     # ==================================================================
 
-    def get_document_tree(self, content_strategy: str = "first_lines",
-                          depth: int = 1,
-                          file_path: str = None) -> Dict[str, Any]:
+    OVERVIEW_PARTS = ("tree", "summaries", "count", "pages")
+
+    def get_document_overview(self, file_path: str = None,
+                              include=OVERVIEW_PARTS,
+                              content_strategy: str = "first_lines",
+                              depth: int = 1) -> Dict[str, Any]:
+        """Tree, AI summaries, paragraph count and pages in one call.
+
+        The document is resolved once and every part is served from
+        the same paragraph snapshot, bookmark map and summaries map.
+        """
         try:
             doc = self._base.resolve_document(file_path)
-            if not self._base.is_writer(doc):
+            include = set(include or self.OVERVIEW_PARTS)
+            unknown = include.difference(self.OVERVIEW_PARTS)
+            if unknown:
+                return {"success": False,
+                        "error": f"Unknown overview parts: "
+                                 f"{', '.join(sorted(unknown))}. "
+                                 f"Use: {', '.join(self.OVERVIEW_PARTS)}"}
+            if "tree" in include and not self._base.is_writer(doc):
                 return {"success": False, "error": "Not a Writer document"}
 
-            tree = self.build_heading_tree(doc)
-            bookmark_map = self.ensure_heading_bookmarks(doc)
-            ai_summaries = (
-                self.get_ai_summaries_map(doc)
-                if content_strategy in ("ai_summary_first", "first_lines")
-                else {})
+            snap = self._snapshot_paragraphs(doc)
+            result = {"success": True}
 
-            children = [
-                self._serialize_tree_node(
-                    child, doc, ai_summaries, content_strategy,
-                    depth, bookmark_map=bookmark_map)
-                for child in tree["children"]
-            ]
-
-            text = doc.getText()
-            enum = text.createEnumeration()
-            total = 0
-            while enum.hasMoreElements():
-                enum.nextElement()
-                total += 1
-
-            try:
-                self._base.annotate_pages(children, doc)
-            except Exception:
-                pass
-
-            page_count = 0
-            try:
-                controller = doc.getCurrentController()
-                vc = controller.getViewCursor()
-                saved = text.createTextCursorByRange(vc.getStart())
-                doc.lockControllers()
+            ai_summaries = {}
+            if "summaries" in include or (
+                    "tree" in include and content_strategy in (
+                        "ai_summary_first", "first_lines")):
+                ai_summaries = self.get_ai_summaries_map(doc)
+
+            children = []
+            if "tree" in include:
+                tree = self.build_heading_tree(doc)
+                bookmark_map = self.ensure_heading_bookmarks(doc)
+                children = [
+                    self._serialize_tree_node(
+                        child, doc, ai_summaries, content_strategy,
+                        depth, bookmark_map=bookmark_map)
+                    for child in tree["children"]
+                ]
+                result.update({
+                    "content_strategy": content_strategy,
+                    "depth": depth,
+                    "children": children,
+                    "body_before_first_heading": tree["body_paragraphs"],
+                    "total_paragraphs": len(snap),
+                })
+
+            if "pages" in include:
+                page_count = 0
                 try:
-                    cursor = text.createTextCursor()
-                    cursor.gotoEnd(False)
-                    page_count = self._base.get_page_for_range(
-                        doc, cursor)
-                finally:
-                    vc.gotoRange(saved, False)
-                    doc.unlockControllers()
-            except Exception:
-                pass
+                    page_count, children = self._collect_pages(
+                        doc, children)
+                except Exception:
+                    pass
+                result["page_count"] = page_count
 
-            return {
-                "success": True,
-                "content_strategy": content_strategy,
-                "depth": depth,
-                "children": children,
-                "body_before_first_heading": tree["body_paragraphs"],
-                "total_paragraphs": total,
-                "page_count": page_count,
-            }
+            if "count" in include:
+                result["paragraph_count"] = sum(snap.is_para)
+                result["total_paragraphs"] = len(snap)
+
+            if "summaries" in include:
+                result["summaries"] = [
+                    {"para_index": idx, "summary": text}
+                    for idx, text in sorted(ai_summaries.items())]
+                result["summary_count"] = len(ai_summaries)
+
+            return result
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def get_document_tree(self, content_strategy: str = "first_lines",
+                          depth: int = 1,
+                          file_path: str = None) -> Dict[str, Any]:
+        return self.get_document_overview(
+            file_path, ("tree", "pages"), content_strategy, depth)
+
     def get_heading_children(self, heading_para_index: int = None,
                              heading_bookmark: str = None,
                              locator: str = None,
@@ -459,47 +528,29 @@ class TreeService:
                 else {})
 
             children = []
-            text = doc.getText()
-            enum = text.createEnumeration()
-            idx = 0
-            found_heading = False
-            parent_level = target["level"]
-
-            while enum.hasMoreElements():
-                element = enum.nextElement()
-                is_para = element.supportsService(
-                    "com.sun.star.text.Paragraph")
-                if idx == heading_para_index:
-                    found_heading = True
-                    idx += 1
+            snap = self._snapshot_paragraphs(doc)
+            end = snap.next_heading_after(heading_para_index)
+            preview_max = self._PREVIEW_MAX
+            ellipsis = self._ELLIPSIS
+
+            for idx in range(heading_para_index + 1, end):
+                if not snap.is_para[idx]:
                     continue
-                if found_heading and is_para:
-                    outline_level = 0
-                    try:
-                        outline_level = element.getPropertyValue(
-                            "OutlineLevel")
-                    except Exception:
-                        pass
-                    if outline_level > 0 and outline_level <= parent_level:
-                        break
-                    if outline_level > 0:
-                        break
-                    para_text = element.getString()
-                    preview = (para_text[:100] + "..."
-                               if len(para_text) > 100 else para_text)
-                    if content_strategy == "full":
-                        children.append({"type": "body",
-                                         "para_index": idx,
-                                         "text": para_text})
-                    elif content_strategy != "none":
-                        children.append({"type": "body",
-                                         "para_index": idx,
-                                         "preview": preview})
-                    else:
-                        children.append({"type": "body",
-                                         "para_index": idx})
-                idx += 1
-                self._base.yield_to_gui()
+                if content_strategy == "none":
+                    children.append({"type": "body",
+                                     "para_index": idx})
+                    continue
+                para_text = snap.elements[idx].getString()
+                if content_strategy == "full":
+                    children.append({"type": "body",
+                                     "para_index": idx,
+                                     "text": para_text})
+                else:
+                    preview = (para_text if len(para_text) <= preview_max
+                               else para_text[:preview_max] + ellipsis)
+                    children.append({"type": "body",
+                                     "para_index": idx,
+                                     "preview": preview})
 
             for child in target["children"]:
                 node = self._serialize_tree_node(
@@ -554,12 +605,14 @@ class TreeService:
             cursor = doc_text.createTextCursorByRange(target.getStart())
             doc_text.insertTextContent(cursor, annotation, False)
 
-            # Invalidate AI summary cache
+            # Invalidate AI summary + bookmark + comment caches
             self._ai_summary_cache.pop(
                 self._base.doc_key(doc), None)
+            self.invalidate_bookmarks(doc)
+            self._writer._registry.comments.invalidate_cache(doc)
 
-            if doc.hasLocation():
-                self._base.store_doc(doc)
+            if self._base.has_location(doc):
+                self._base.schedule_store(doc)
 
             return {"success": True,
                     "message": f"Added AI summary at paragraph {para_index}",
@@ -569,15 +622,11 @@ class TreeService:
             return {"success": False, "error": str(e)}
 
     def get_ai_summaries(self, file_path: str = None) -> Dict[str, Any]:
-        try:
-            doc = self._base.resolve_document(file_path)
-            summaries_map = self.get_ai_summaries_map(doc)
-            summaries = [{"para_index": idx, "summary": text}
-                         for idx, text in sorted(summaries_map.items())]
-            return {"success": True, "summaries": summaries,
-                    "count": len(summaries)}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        result = self.get_document_overview(file_path, ("summaries",))
+        if not result.get("success"):
+            return result
+        return {"success": True, "summaries": result["summaries"],
+                "count": result["summary_count"]}
 
     def remove_ai_summary(self, para_index: int = None,
                           locator: str = None,
@@ -591,39 +640,40 @@ class TreeService:
                 return {"success": False,
                         "error": "Provide locator or para_index"}
             removed = self._remove_ai_annotation_at(doc, para_index)
-            # Invalidate AI summary cache
+            # Invalidate AI summary + bookmark + comment caches
             self._ai_summary_cache.pop(
                 self._base.doc_key(doc), None)
-            if removed and doc.hasLocation():
-                self._base.store_doc(doc)
+            self.invalidate_bookmarks(doc)
+            self._writer._registry.comments.invalidate_cache(doc)
+            if removed and self._base.has_location(doc):
+                self._base.schedule_store(doc)
             return {"success": True, "removed": removed,
                     "para_index": para_index}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def _ai_annotation_fields(self, doc, refresh: bool = False) -> List:
+        """MCP-AI annotation fields, from the comment service's index."""
+        index = self._writer._registry.comments._comment_index(
+            doc, refresh=refresh)
+        return index["by_author"].get("MCP-AI", [])
+
     def _remove_ai_annotation_at(self, doc, para_index: int) -> bool:
         try:
-            fields = doc.getTextFields()
-            enum = fields.createEnumeration()
             para_ranges = self._writer.get_paragraph_ranges(doc)
             text_obj = doc.getText()
-            while enum.hasMoreElements():
-                field = enum.nextElement()
-                if not field.supportsService(
-                        "com.sun.star.text.textfield.Annotation"):
-                    continue
-                try:
-                    author = field.getPropertyValue("Author")
-                except Exception:
-                    continue
-                if author != "MCP-AI":
-                    continue
-                anchor = field.getAnchor()
-                idx = self._writer.find_paragraph_for_range(
-                    anchor, para_ranges, text_obj)
-                if idx == para_index:
-                    text_obj.removeTextContent(field)
-                    return True
+            # Cached index first; one fresh pass if it had no match
+            for refresh in (False, True):
+                for field in self._ai_annotation_fields(doc, refresh):
+                    try:
+                        anchor = field.getAnchor()
+                    except Exception:
+                        continue  # removed since the index was built
+                    idx = self._writer.find_paragraph_for_range(
+                        anchor, para_ranges, text_obj)
+                    if idx == para_index:
+                        text_obj.removeTextContent(field)
+                        return True
         except Exception as e:
             logger.error("Failed to remove AI annotation: %s", e)
         return False
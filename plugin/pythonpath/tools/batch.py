@@ -204,7 +204,7 @@ class ExecuteBatch(McpTool):
     description = (
         "Execute multiple tool calls in a single request (one human "
         "approval). Operations run sequentially with batch mode "
-        "(caches/indexing deferred to end). "
+        "(caches, indexing and saves deferred to end). "
         "Stops on first error by default. "
         "Checks for human stop signals between operations. "
         "BATCH VARIABLES: $last = paragraph_index from previous step "
@@ -423,8 +423,12 @@ class ExecuteBatch(McpTool):
         if follow == "end" and last_result and not stopped:
             _follow_result(self.services, last_result)
 
-        # ── Exit batch mode — single invalidate + prewarm ──
+        # ── Exit batch mode — single save + invalidate + prewarm ──
         self.services.batch_mode = False
+        try:
+            self.services.base.flush_pending_stores()
+        except Exception:
+            pass
         try:
             self.services.writer.invalidate_caches()
         except Exception:
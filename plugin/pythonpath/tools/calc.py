@@ -28,7 +28,7 @@ class ReadSpreadsheetCells(McpTool):
     }
 
     def execute(self, range_str, file_path=None, **_):
-        return self.services.calc.read_cells(range_str, file_path)
+        return self.services.calc.read_cells(range_str, file_path=file_path)
 
 
 class WriteSpreadsheetCell(McpTool):
@@ -59,7 +59,41 @@ class WriteSpreadsheetCell(McpTool):
     }
 
     def execute(self, cell, value, file_path=None, **_):
-        return self.services.calc.write_cell(cell, value, file_path)
+        return self.services.calc.write_cell(cell, value, file_path=file_path)
+
+
+class WriteSpreadsheetCells(McpTool):
+    name = "write_cells"
+    description = (
+        "Write a block of values to a Calc spreadsheet in one call "
+        "(one save), starting at the top-left cell. "
+        "Numbers are auto-detected."
+    )
+    parameters = {
+        "type": "object",
+        "properties": {
+            "start_cell": {
+                "type": "string",
+                "description": "Top-left cell (e.g. 'B3'). "
+                               "Prefix with sheet name for a specific sheet "
+                               "(e.g. 'Sheet1.B3').",
+            },
+            "data": {
+                "type": "array",
+                "items": {"type": "array", "items": {}},
+                "description": "Rows of values, all the same length",
+            },
+            "file_path": {
+                "type": "string",
+                "description": "Absolute path to the spreadsheet (optional)",
+            },
+        },
+        "required": ["start_cell", "data"],
+    }
+
+    def execute(self, start_cell, data, file_path=None, **_):
+        return self.services.calc.write_cells(
+            start_cell, data, file_path=file_path)
 
 
 class ListSpreadsheetSheets(McpTool):
@@ -32,37 +32,33 @@ class DocumentHealthCheck(McpTool):
         headings = []
         while enum.hasMoreElements():
             el = enum.nextElement()
-            if not el.supportsService("com.sun.star.text.Paragraph"):
+            level = self.services.writer.outline_level(el)
+            if not level:
                 idx += 1
                 continue
-            try:
-                level = el.getPropertyValue("OutlineLevel")
-            except Exception:
-                level = 0
-            if level > 0:
-                text = el.getString().strip()
-                headings.append({
-                    "para_index": idx, "level": level, "text": text})
-                if not text:
-                    issues.append({
-                        "severity": "warning",
-                        "type": "empty_heading",
-                        "para_index": idx,
-                        "level": level,
-                        "message": f"Empty heading (level {level}) "
-                                   f"at paragraph {idx}",
-                    })
-                # Check heading level jumps (e.g. H1 -> H3, skipping H2)
-                if prev_level > 0 and level > prev_level + 1:
-                    issues.append({
-                        "severity": "info",
-                        "type": "heading_level_skip",
-                        "para_index": idx,
-                        "message": f"Heading level jumps from {prev_level} "
-                                   f"to {level} at paragraph {idx}: "
-                                   f"'{text[:50]}'",
-                    })
-                prev_level = level
+            text = el.getString().strip()
+            headings.append({
+                "para_index": idx, "level": level, "text": text})
+            if not text:
+                issues.append({
+                    "severity": "warning",
+                    "type": "empty_heading",
+                    "para_index": idx,
+                    "level": level,
+                    "message": f"Empty heading (level {level}) "
+                               f"at paragraph {idx}",
+                })
+            # Check heading level jumps (e.g. H1 -> H3, skipping H2)
+            if prev_level > 0 and level > prev_level + 1:
+                issues.append({
+                    "severity": "info",
+                    "type": "heading_level_skip",
+                    "para_index": idx,
+                    "message": f"Heading level jumps from {prev_level} "
+                               f"to {level} at paragraph {idx}: "
+                               f"'{text[:50]}'",
+                })
+            prev_level = level
             idx += 1
 
         # 2. Broken bookmarks (point to nonexistent positions)
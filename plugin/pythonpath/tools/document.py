@@ -94,18 +94,13 @@ class ListOpenDocumentsLive(McpTool):
                 if controller:
                     doc = controller.getModel()
                     if doc and hasattr(doc, "getURL"):
-                        import urllib.parse
                         url = doc.getURL()
                         doc_type = self.services.base.get_document_type(doc)
                         entry = {"type": doc_type}
                         if url:
                             entry["url"] = url
-                            try:
-                                entry["path"] = urllib.parse.unquote(
-                                    url.replace("file:///", "")
-                                ).replace("/", "\\")
-                            except Exception:
-                                pass
+                            entry["path"] = self.services.base.url_to_path(
+                                url)
                         documents.append(entry)
             return {"success": True, "documents": documents,
                     "count": len(documents)}
@@ -135,6 +130,28 @@ class SaveActiveDocument(McpTool):
             return {"success": False, "error": str(e)}
 
 
+class FlushPendingSaves(McpTool):
+    name = "flush_pending_saves"
+    description = (
+        "Write debounced saves to disk now. Single edits (paragraph "
+        "text/style, cells, properties) are saved shortly after the "
+        "last write; call this before reading the file from outside "
+        "LibreOffice. Without file_path, flushes every document."
+    )
+    parameters = {
+        "type": "object",
+        "properties": {
+            "file_path": {
+                "type": "string",
+                "description": "Absolute path to the document (optional)",
+            },
+        },
+    }
+
+    def execute(self, file_path=None, **_):
+        return self.services.base.flush_pending_saves(file_path)
+
+
 class SaveDocumentCopy(McpTool):
     name = "save_document_as"
     description = "Save/duplicate a document under a new name."
@@ -107,3 +107,44 @@ class SetDocumentFrameProperties(McpTool):
             frame_name, width_mm, height_mm, anchor_type,
             hori_orient, vert_orient, hori_pos_mm, vert_pos_mm,
             wrap, paragraph_index, file_path)
+
+
+class SetDocumentFramesProperties(McpTool):
+    name = "set_text_frames_properties"
+    description = (
+        "Modify several text frames in one call (one save). Each entry "
+        "takes frame_name plus the set_text_frame_properties fields."
+    )
+    parameters = {
+        "type": "object",
+        "properties": {
+            "updates": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        k: v for k, v in
+                        SetDocumentFrameProperties.parameters[
+                            "properties"].items()
+                        if k != "file_path"
+                    },
+                    "required": ["frame_name"],
+                },
+                "description": "List of per-frame changes",
+            },
+            "verbose": {
+                "type": "boolean",
+                "description": "Report changes as readable labels instead "
+                               "of [field, value] pairs (default: false)",
+            },
+            "file_path": {
+                "type": "string",
+                "description": "Absolute path to the document (optional)",
+            },
+        },
+        "required": ["updates"],
+    }
+
+    def execute(self, updates, file_path=None, verbose=False, **_):
+        return self.services.images.set_text_frames_properties(
+            updates, file_path, verbose)
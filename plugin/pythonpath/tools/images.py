@@ -111,6 +111,48 @@ class SetDocumentImageProperties(McpTool):
             file_path)
 
 
+class SetDocumentImagesProperties(McpTool):
+    name = "set_images_properties"
+    description = (
+        "Resize, reposition, crop, or retitle several images in one call "
+        "(one save). Each entry takes image_name plus the "
+        "set_image_properties fields."
+    )
+    parameters = {
+        "type": "object",
+        "properties": {
+            "updates": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        k: v for k, v in
+                        SetDocumentImageProperties.parameters[
+                            "properties"].items()
+                        if k != "file_path"
+                    },
+                    "required": ["image_name"],
+                },
+                "description": "List of per-image changes",
+            },
+            "verbose": {
+                "type": "boolean",
+                "description": "Report changes as readable labels instead "
+                               "of [field, value] pairs (default: false)",
+            },
+            "file_path": {
+                "type": "string",
+                "description": "Absolute path to the document (optional)",
+            },
+        },
+        "required": ["updates"],
+    }
+
+    def execute(self, updates, file_path=None, verbose=False, **_):
+        return self.services.images.set_images_properties(
+            updates, file_path, verbose)
+
+
 class DownloadImage(McpTool):
     name = "download_image"
     description = (
@@ -207,6 +249,52 @@ class InsertDocumentImage(McpTool):
             with_frame, width_mm, height_mm, verify_ssl, file_path)
 
 
+class InsertDocumentImagesBulk(McpTool):
+    name = "insert_images_bulk"
+    description = (
+        "Insert several images in one call, saved once at the end. "
+        "Each entry takes the insert_image arguments. Entries that fail "
+        "are reported individually; the others are still inserted."
+    )
+    parameters = {
+        "type": "object",
+        "properties": {
+            "images": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "image_path": {"type": "string"},
+                        "locator": {"type": "string"},
+                        "paragraph_index": {"type": "integer"},
+                        "caption": {"type": "string"},
+                        "with_frame": {"type": "boolean"},
+                        "width_mm": {"type": "integer"},
+                        "height_mm": {"type": "integer"},
+                    },
+                    "required": ["image_path"],
+                },
+                "description": "List of images to insert "
+                               "(same fields as insert_image)",
+            },
+            "verify_ssl": {
+                "type": "boolean",
+                "description": "Verify SSL certificates when downloading "
+                               "from URLs (default: false)",
+            },
+            "file_path": {
+                "type": "string",
+                "description": "Absolute path to the document (optional)",
+            },
+        },
+        "required": ["images"],
+    }
+
+    def execute(self, images, verify_ssl=False, file_path=None, **_):
+        return self.services.images.insert_images_bulk(
+            images, verify_ssl, file_path)
+
+
 class DeleteDocumentImage(McpTool):
     name = "delete_image"
     description = (
@@ -7,11 +7,21 @@ class ListPresentationSlides(McpTool):
     name = "list_slides"
     description = (
         "List all slides in an Impress presentation. "
-        "Returns slide count, names, layout info, and first-shape title."
+        "Returns slide count, names, layout info, and first-shape title. "
+        "Use start_index/max_slides to page through large decks."
     )
     parameters = {
         "type": "object",
         "properties": {
+            "start_index": {
+                "type": "integer",
+                "description": "Zero-based index of first slide (default: 0)",
+            },
+            "max_slides": {
+                "type": "integer",
+                "description": "Maximum number of slides to list "
+                               "(default: all)",
+            },
             "file_path": {
                 "type": "string",
                 "description": "Absolute path to the presentation (optional)",
@@ -19,8 +29,9 @@ class ListPresentationSlides(McpTool):
         },
     }
 
-    def execute(self, file_path=None, **_):
-        return self.services.impress.list_slides(file_path)
+    def execute(self, start_index=0, max_slides=None, file_path=None, **_):
+        return self.services.impress.list_slides(
+            start_index, max_slides, file_path)
 
 
 class ReadPresentationSlide(McpTool):
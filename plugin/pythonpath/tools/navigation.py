@@ -37,6 +37,48 @@ class GetDocumentTree(McpTool):
             content_strategy, depth, file_path)
 
 
+class GetDocumentOverview(McpTool):
+    name = "get_document_overview"
+    description = (
+        "One-call document overview: heading tree, AI summaries, "
+        "paragraph count and page count from a single document scan. "
+        "Use instead of calling get_document_tree, get_ai_summaries "
+        "and get_paragraph_count back-to-back. 'include' selects the "
+        "parts (default: all)."
+    )
+    parameters = {
+        "type": "object",
+        "properties": {
+            "include": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": ["tree", "summaries", "count", "pages"],
+                },
+                "description": "Parts to return (default: all four)",
+            },
+            "content_strategy": {
+                "type": "string",
+                "enum": ["none", "first_lines", "ai_summary_first", "full"],
+                "description": "Body text in the tree (default: first_lines)",
+            },
+            "depth": {
+                "type": "integer",
+                "description": "Heading levels to return (default: 1)",
+            },
+            "file_path": {
+                "type": "string",
+                "description": "Absolute path to the document (optional)",
+            },
+        },
+    }
+
+    def execute(self, include=None, content_strategy="first_lines",
+                depth=1, file_path=None, **_):
+        return self.services.writer.get_document_overview(
+            file_path, include, content_strategy, depth)
+
+
 class GetHeadingChildren(McpTool):
     name = "get_heading_children"
     description = (
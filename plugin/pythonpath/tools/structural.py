@@ -117,6 +117,11 @@ class UpdateDocumentFields(McpTool):
     parameters = {
         "type": "object",
         "properties": {
+            "include_count": {
+                "type": "boolean",
+                "description": "Report fields_refreshed (walks every "
+                               "field; default: true, false to skip)",
+            },
             "file_path": {
                 "type": "string",
                 "description": "Absolute path to the document (optional)",
@@ -124,5 +129,5 @@ class UpdateDocumentFields(McpTool):
         },
     }
 
-    def execute(self, file_path=None, **_):
-        return self.services.writer.update_fields(file_path)
+    def execute(self, file_path=None, include_count=True, **_):
+        return self.services.writer.update_fields(file_path, include_count)
@@ -52,7 +52,9 @@ class WriteDocumentTableCell(McpTool):
     name = "write_table_cell"
     description = (
         "Write to a cell in a Writer table. "
-        "Numbers are auto-detected. Use cell addresses like A1, B3, etc."
+        "Numbers are auto-detected (set value_type to force). "
+        "Use cell addresses like A1, B3, etc. "
+        "For several cells use write_table_cells (one save)."
     )
     parameters = {
         "type": "object",
@@ -69,6 +71,11 @@ class WriteDocumentTableCell(McpTool):
                 "type": "string",
                 "description": "Value to write",
             },
+            "value_type": {
+                "type": "string",
+                "enum": ["auto", "string", "number"],
+                "description": "How to store the value (default: auto)",
+            },
             "file_path": {
                 "type": "string",
                 "description": "Absolute path to the document (optional)",
@@ -77,9 +84,55 @@ class WriteDocumentTableCell(McpTool):
         "required": ["table_name", "cell", "value"],
     }
 
-    def execute(self, table_name, cell, value, file_path=None, **_):
+    def execute(self, table_name, cell, value, value_type="auto",
+                file_path=None, **_):
         return self.services.tables.write_table_cell(
-            table_name, cell, value, file_path)
+            table_name, cell, value, value_type, file_path)
+
+
+class WriteDocumentTableCells(McpTool):
+    name = "write_table_cells"
+    description = (
+        "Write several cells of a Writer table in one call (one save). "
+        "A full rectangle of cells is written in a single block. "
+        "Numbers are auto-detected unless value_type is set."
+    )
+    parameters = {
+        "type": "object",
+        "properties": {
+            "table_name": {
+                "type": "string",
+                "description": "Name of the table",
+            },
+            "cells": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "cell": {"type": "string"},
+                        "value": {"type": "string"},
+                    },
+                    "required": ["cell", "value"],
+                },
+                "description": "List of {cell, value} (e.g. {cell: 'B2', value: '42'})",
+            },
+            "value_type": {
+                "type": "string",
+                "enum": ["auto", "string", "number"],
+                "description": "How to store the values (default: auto)",
+            },
+            "file_path": {
+                "type": "string",
+                "description": "Absolute path to the document (optional)",
+            },
+        },
+        "required": ["table_name", "cells"],
+    }
+
+    def execute(self, table_name, cells, value_type="auto",
+                file_path=None, **_):
+        return self.services.tables.write_table_cells(
+            table_name, cells, value_type, file_path)
 
 
 class CreateDocumentTable(McpTool):